@@ -3,7 +3,7 @@ Heinrich TRIZ Engine - Knowledge Base Loader
 Loads and provides access to TRIZ knowledge base components.
 """
 
-import yaml
+from heinrich.utils.yaml_loader import safe_load
 import csv
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
@@ -22,7 +22,7 @@ class KnowledgeLoader:
         """Load the 39 TRIZ parameters."""
         if self.parameters is None:
             with open(self.knowledge_path / "39_parameters.yaml", 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
                 self.parameters = {p['id']: p for p in data['parameters']}
         return self.parameters
 
@@ -30,7 +30,7 @@ class KnowledgeLoader:
         """Load the 40 TRIZ principles."""
         if self.principles is None:
             with open(self.knowledge_path / "40_principles.yaml", 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
                 self.principles = {p['id']: p for p in data['principles']}
         return self.principles
 
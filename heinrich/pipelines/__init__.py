@@ -3,7 +3,7 @@ Heinrich Pipeline Modules
 Core TRIZ processing pipeline components.
 """
 
-from heinrich.pipelines.problem_parser import ProblemParser, ParsedProblem
+from heinrich.pipelines.problem_parser import ProblemParser, ParsedProblem, ParsedProblemBatch
 from heinrich.pipelines.contradiction_identifier import ContradictionIdentifier, ContradictionResult
 from heinrich.pipelines.principle_selector import PrincipleSelector, PrincipleSelectionResult
 from heinrich.pipelines.effects_lookup import EffectsLookup, EffectRecommendation
@@ -14,6 +14,7 @@ from heinrich.pipelines.report_builder import ReportBuilder, TRIZReport
 __all__ = [
     "ProblemParser",
     "ParsedProblem",
+    "ParsedProblemBatch",
     "ContradictionIdentifier",
     "ContradictionResult",
     "PrincipleSelector",
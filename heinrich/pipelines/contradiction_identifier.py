@@ -6,7 +6,7 @@ Maps problems to the 39 TRIZ parameters and identifies technical contradictions.
 import re
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import yaml
+from heinrich.utils.yaml_loader import safe_load
 
 @dataclass
 class TechnicalContradiction:
@@ -33,7 +33,7 @@ class ContradictionIdentifier:
     def __init__(self, parameters_file: str = "heinrich/knowledge/39_parameters.yaml"):
         """Initialize with TRIZ parameters knowledge base."""
         with open(parameters_file, 'r', encoding='utf-8') as f:
-            self.parameters_data = yaml.safe_load(f)
+            self.parameters_data = safe_load(f)
 
         self.parameters = self.parameters_data['parameters']
         self.parameter_keywords = self._build_parameter_keywords()
@@ -118,6 +118,18 @@ class ContradictionIdentifier:
             alternative_contradictions=alternatives
         )
 
+    def identify_contradiction_batch(self, problem_texts: List[str]) -> List[ContradictionResult]:
+        """
+        Identify technical contradictions for several problems in one call.
+
+        Args:
+            problem_texts: Natural language problem descriptions
+
+        Returns:
+            ContradictionResult for each input, in the same order
+        """
+        return [self.identify_contradiction(problem_text) for problem_text in problem_texts]
+
     def _find_improvement_parameters(self, text: str) -> List[Tuple[int, float]]:
         """Find parameters that represent desired improvements."""
         candidates = []
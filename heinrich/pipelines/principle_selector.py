@@ -3,10 +3,17 @@ Heinrich TRIZ Engine - Principle Selector Module
 Selects relevant TRIZ principles using the contradiction matrix.
 """
 
-import yaml
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from heinrich.utils.yaml_loader import safe_load
+from typing import Dict, List, Optional, Sequence
 from dataclasses import dataclass
 
+# Contradiction matrix layout: parameter IDs (1-39) index rows and columns
+# directly, and each cell holds up to MAX_CELL_PRINCIPLES principle IDs padded
+# with zeros (0 is never a valid principle ID)
+MATRIX_DIM = 40
+MAX_CELL_PRINCIPLES = 4
+
 @dataclass
 class PrincipleRecommendation:
     """Represents a recommended TRIZ principle for solving a contradiction."""
@@ -32,20 +39,25 @@ class PrincipleSelector:
 
     def __init__(self,
                  principles_file: str = "heinrich/knowledge/40_principles.yaml",
-                 matrix_file: str = "heinrich/knowledge/contradiction_matrix.csv"):
+                 matrix_file: str = "heinrich/knowledge/contradiction_matrix.csv",
+                 parameters_file: str = "heinrich/knowledge/39_parameters.yaml"):
         """Initialize with TRIZ principles and contradiction matrix."""
+        # Load 39 parameters (used for reasoning text)
+        with open(parameters_file, 'r', encoding='utf-8') as f:
+            self.parameters_data = safe_load(f)
+
         # Load 40 principles
         with open(principles_file, 'r', encoding='utf-8') as f:
-            self.principles_data = yaml.safe_load(f)
+            self.principles_data = safe_load(f)
 
         self.principles = {p['id']: p for p in self.principles_data['principles']}
 
         # Load contradiction matrix (simplified version for now)
         self.contradiction_matrix = self._load_contradiction_matrix(matrix_file)
 
-    def _load_contradiction_matrix(self, matrix_file: str) -> Dict[Tuple[int, int], List[int]]:
-        """Load the 39x39 contradiction matrix."""
-        matrix = {}
+    def _load_contradiction_matrix(self, matrix_file: str) -> np.ndarray:
+        """Load the 39x39 contradiction matrix as a dense principle-ID array."""
+        matrix = np.zeros((MATRIX_DIM, MATRIX_DIM, MAX_CELL_PRINCIPLES), dtype=np.int8)
 
         # For now, create a simplified matrix with some known relationships
         # In a full implementation, this would load from a CSV file
@@ -73,11 +85,18 @@ class PrincipleSelector:
 
         for (param1, param2), principles in known_relationships:
             # Matrix is symmetric
-            matrix[(param1, param2)] = principles
-            matrix[(param2, param1)] = principles
+            matrix[param1, param2, :len(principles)] = principles
+            matrix[param2, param1, :len(principles)] = principles
 
         return matrix
 
+    def _matrix_principles(self, improving_param: int, worsening_param: int) -> List[int]:
+        """Get the principle IDs in a matrix cell (empty if there is no entry)."""
+        if not (0 < improving_param < MATRIX_DIM and 0 < worsening_param < MATRIX_DIM):
+            return []
+        cell = self.contradiction_matrix[improving_param, worsening_param]
+        return cell[cell != 0].tolist()
+
     def select_principles(self, improving_param: int, worsening_param: int) -> PrincipleSelectionResult:
         """
         Select TRIZ principles for a specific contradiction.
@@ -89,10 +108,14 @@ class PrincipleSelector:
         Returns:
             PrincipleSelectionResult with recommended principles
         """
-        matrix_key = (improving_param, worsening_param)
-
-        if matrix_key in self.contradiction_matrix:
-            principle_ids = self.contradiction_matrix[matrix_key]
+        principle_ids = self._matrix_principles(improving_param, worsening_param)
+        return self._build_selection_result(improving_param, worsening_param, principle_ids)
+
+    def _build_selection_result(self, improving_param: int, worsening_param: int,
+                                matrix_principle_ids: Sequence[int]) -> PrincipleSelectionResult:
+        """Turn the matrix principles for a contradiction into ranked recommendations."""
+        if matrix_principle_ids:
+            principle_ids = list(matrix_principle_ids)
         else:
             # No direct mapping found, use heuristic approach
             principle_ids = self._heuristic_principle_selection(improving_param, worsening_param)
@@ -130,7 +153,7 @@ class PrincipleSelector:
             recommendations=recommendations,
             primary_principles=primary_principles,
             supporting_principles=supporting_principles,
-            matrix_source="contradiction_matrix" if matrix_key in self.contradiction_matrix else "heuristic"
+            matrix_source="contradiction_matrix" if matrix_principle_ids else "heuristic"
         )
 
     def _heuristic_principle_selection(self, improving_param: int, worsening_param: int) -> List[int]:
@@ -162,7 +185,7 @@ class PrincipleSelector:
     def _calculate_relevance_score(self, principle_id: int, improving_param: int, worsening_param: int) -> float:
         """Calculate how relevant a principle is for this contradiction."""
         # Base score from matrix (0.8 if direct match, 0.4 if heuristic)
-        base_score = 0.8 if (improving_param, worsening_param) in self.contradiction_matrix else 0.4
+        base_score = 0.8 if self._matrix_principles(improving_param, worsening_param) else 0.4
 
         # Adjust based on principle characteristics
         principle_data = self.principles[principle_id]
@@ -216,12 +239,20 @@ class PrincipleSelector:
         Returns:
             List of PrincipleSelectionResult objects
         """
-        results = []
-        for contradiction in contradictions:
-            result = self.select_principles(
-                contradiction['improving_parameter'],
-                contradiction['worsening_parameter']
-            )
-            results.append(result)
-
-        return results
+        if not contradictions:
+            return []
+
+        improving = np.array([c['improving_parameter'] for c in contradictions])
+        worsening = np.array([c['worsening_parameter'] for c in contradictions])
+
+        # Gather every matrix cell in one indexing operation; out-of-range
+        # parameter IDs map to cell (0, 0), which is always empty
+        in_range = ((improving > 0) & (improving < MATRIX_DIM) &
+                    (worsening > 0) & (worsening < MATRIX_DIM))
+        cells = self.contradiction_matrix[np.where(in_range, improving, 0),
+                                          np.where(in_range, worsening, 0)]
+
+        return [
+            self._build_selection_result(int(imp), int(wors), cell[cell != 0].tolist())
+            for imp, wors, cell in zip(improving, worsening, cells)
+        ]
@@ -1,12 +1,13 @@
-
 """
 Heinrich TRIZ Engine - Problem Parser Module
 Extracts and normalizes problem descriptions for TRIZ analysis.
 """
 
 import re
-from typing import Dict, List, Optional
 from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -16,24 +17,91 @@ class ParsedProblem:
     original_text: str
     normalized_description: str
     technical_system: Optional[str]
-    desired_improvement: Optional[str] 
+    desired_improvement: Optional[str]
     undesired_consequence: Optional[str]
     constraints: List[str]
     context: Dict[str, str]
 
 
+@dataclass
+class ParsedProblemBatch:
+    """
+    Column-oriented results for many parsed problems.
+
+    Each field holds one entry per problem, in input order. The optional
+    string columns are object arrays so they can be filtered with NumPy,
+    e.g. ``batch.context_domain == 'automotive'``.
+    """
+
+    original_text: List[str]
+    normalized_description: List[str]
+    technical_system: np.ndarray
+    desired_improvement: np.ndarray
+    undesired_consequence: np.ndarray
+    constraints: List[List[str]]
+    context_domain: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.original_text)
+
+    def problem(self, index: int) -> ParsedProblem:
+        """Materialize a single row as a ParsedProblem."""
+        return ParsedProblem(
+            original_text=self.original_text[index],
+            normalized_description=self.normalized_description[index],
+            technical_system=self.technical_system[index],
+            desired_improvement=self.desired_improvement[index],
+            undesired_consequence=self.undesired_consequence[index],
+            constraints=self.constraints[index],
+            context={"domain": self.context_domain[index]},
+        )
+
+
 class ProblemParser:
     """Parses and normalizes problem descriptions for TRIZ analysis."""
 
+    # System terms in priority order: an earlier group wins over a later one
+    # regardless of where it appears in the text
+    _SYSTEM_GROUPS = (
+        ("car", "vehicle", "automobile"),
+        ("engine", "motor"),
+        ("machine", "device", "system"),
+    )
+    _SYSTEM_RANK = {term: rank for rank, group in enumerate(_SYSTEM_GROUPS) for term in group}
+    _SYSTEM_RE = re.compile("(" + "|".join(_SYSTEM_RANK) + ")")
+    # Lookahead so a constraint word can itself be the object of another one
+    _CONSTRAINT_RE = re.compile(r"(?=(?:without|must not|cannot)\s+(\w+))")
+    # Domain keywords in priority order, first matching domain wins
+    _DOMAIN_KEYWORDS = (
+        ("automotive", ("car", "vehicle", "engine")),
+        ("manufacturing", ("machine", "manufacturing")),
+    )
+    # Flattened (keyword, domain) pairs, still in priority order
+    _DOMAIN_MARKERS = tuple((word, domain) for domain, words in _DOMAIN_KEYWORDS for word in words)
+
     def __init__(self):
         self.improvement_keywords = [
-            'faster', 'stronger', 'lighter', 'cheaper', 'more efficient',
-            'increase', 'improve', 'enhance', 'optimize', 'better'
+            "faster",
+            "stronger",
+            "lighter",
+            "cheaper",
+            "more efficient",
+            "increase",
+            "improve",
+            "enhance",
+            "optimize",
+            "better",
         ]
 
         self.consequence_keywords = [
-            'but', 'however', 'causes', 'results in', 'leads to',
-            'at the cost of', 'unfortunately', 'downside'
+            "but",
+            "however",
+            "causes",
+            "results in",
+            "leads to",
+            "at the cost of",
+            "unfortunately",
+            "downside",
         ]
 
     def parse(self, problem_text: str) -> ParsedProblem:
@@ -70,31 +138,74 @@ class ProblemParser:
             desired_improvement=improvement,
             undesired_consequence=consequence,
             constraints=constraints,
-            context=context
+            context=context,
+        )
+
+    def parse_batch(self, problem_texts: List[str]) -> List[ParsedProblem]:
+        """
+        Parse several problem descriptions in one call.
+
+        Args:
+            problem_texts: Raw problem descriptions
+
+        Returns:
+            ParsedProblem for each input, in the same order
+        """
+        return [self.parse(problem_text) for problem_text in problem_texts]
+
+    def parse_many(self, problem_texts: List[str]) -> ParsedProblemBatch:
+        """
+        Parse a corpus of problem descriptions into columnar arrays.
+
+        Unlike parse_batch, no ParsedProblem object is created per row.
+
+        Args:
+            problem_texts: Raw problem descriptions
+
+        Returns:
+            ParsedProblemBatch with one entry per input, in the same order
+        """
+        count = len(problem_texts)
+        normalized = [self._normalize_text(text) for text in problem_texts]
+        technical_system = np.empty(count, dtype=object)
+        improvement = np.empty(count, dtype=object)
+        consequence = np.empty(count, dtype=object)
+        domain = np.empty(count, dtype=object)
+
+        for i, text in enumerate(normalized):
+            technical_system[i] = self._extract_technical_system(text)
+            improvement[i] = self._extract_desired_improvement(text)
+            consequence[i] = self._extract_undesired_consequence(text)
+            domain[i] = self._extract_context(text)["domain"]
+
+        return ParsedProblemBatch(
+            original_text=list(problem_texts),
+            normalized_description=normalized,
+            technical_system=technical_system,
+            desired_improvement=improvement,
+            undesired_consequence=consequence,
+            constraints=[self._extract_constraints(text) for text in normalized],
+            context_domain=domain,
         )
 
     def _normalize_text(self, text: str) -> str:
         """Clean and normalize input text."""
-        # Basic cleaning
-        text = re.sub(r'\s+', ' ', text.strip())
-        text = text.lower()
-        return text
+        # str.split() collapses the same whitespace set as re's \s, in C
+        return " ".join(text.split()).lower()
 
     def _extract_technical_system(self, text: str) -> Optional[str]:
         """Extract the technical system being discussed."""
         # Simple pattern matching - in real implementation would be more sophisticated
-        system_patterns = [
-            r'(car|vehicle|automobile)',
-            r'(engine|motor)',
-            r'(machine|device|system)'
-        ]
+        best_rank, best_term = len(self._SYSTEM_GROUPS), None
+        for match in self._SYSTEM_RE.finditer(text):
+            term = match.group(1)
+            rank = self._SYSTEM_RANK[term]
+            if rank < best_rank:
+                best_rank, best_term = rank, term
+                if rank == 0:
+                    break
 
-        for pattern in system_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-
-        return None
+        return best_term
 
     def _extract_desired_improvement(self, text: str) -> Optional[str]:
         """Extract what needs to be improved."""
@@ -107,41 +218,26 @@ class ProblemParser:
         """Extract the undesired side effect."""
         # Look for consequence keywords and extract what follows
         for keyword in self.consequence_keywords:
-            if keyword in text:
-                parts = text.split(keyword, 1)
-                if len(parts) > 1:
-                    consequence = parts[1].strip()
-                    return consequence[:50]  # Truncate for brevity
+            idx = text.find(keyword)
+            if idx != -1:
+                consequence = text[idx + len(keyword) :].strip()
+                return consequence[:50]  # Truncate for brevity
         return None
 
     def _extract_constraints(self, text: str) -> List[str]:
         """Extract any constraints mentioned."""
-        constraints = []
-
-        # Look for constraint indicators
-        constraint_patterns = [
-            r'without (\w+)',
-            r'must not (\w+)',
-            r'cannot (\w+)'
-        ]
-
-        for pattern in constraint_patterns:
-            matches = re.findall(pattern, text)
-            constraints.extend(matches)
-
-        return constraints
+        # Look for constraint indicators ("without", "must not", "cannot")
+        return self._CONSTRAINT_RE.findall(text)
 
     def _extract_context(self, text: str) -> Dict[str, str]:
         """Extract contextual information."""
-        context = {}
+        context = {"domain": "general"}
 
         # Domain detection
-        if any(word in text for word in ['car', 'vehicle', 'engine']):
-            context['domain'] = 'automotive'
-        elif any(word in text for word in ['machine', 'manufacturing']):
-            context['domain'] = 'manufacturing'
-        else:
-            context['domain'] = 'general'
+        for word, domain in self._DOMAIN_MARKERS:
+            if word in text:
+                context["domain"] = domain
+                return context
 
         return context
 
@@ -153,7 +249,7 @@ if __name__ == "__main__":
     test_problems = [
         "We need to make a car faster, but increasing engine power makes it consume more fuel.",
         "The machine needs to be stronger but not heavier.",
-        "Improve product quality without increasing manufacturing time."
+        "Improve product quality without increasing manufacturing time.",
     ]
 
     for problem in test_problems:
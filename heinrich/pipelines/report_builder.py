@@ -4,11 +4,17 @@ Generates comprehensive, structured reports from TRIZ analysis results.
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import textwrap
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional (``perf`` extra); fall back to the stdlib encoder
+    orjson = None
+
 @dataclass
 class ReportSection:
     """A section of the TRIZ analysis report."""
@@ -469,21 +475,37 @@ class ReportBuilder:
         Returns:
             Formatted report string
         """
+        return "".join(self.iter_export_report(report, format_type))
+
+    def iter_export_report(self, report: TRIZReport, format_type: str = "markdown") -> Iterator[str]:
+        """
+        Export report in specified format as a stream of text chunks.
+
+        Markdown is produced section by section so callers can write it out
+        without holding the whole document in memory.
+
+        Args:
+            report: TRIZ report to export
+            format_type: Export format ("markdown", "json", "html")
+
+        Yields:
+            Consecutive chunks of the formatted report
+        """
         if format_type == "json":
-            return self._export_json(report)
+            yield self._export_json(report)
         elif format_type == "html":
-            return self._export_html(report)
+            yield self._export_html(report)
         else:
-            return self._export_markdown(report)
+            yield from self._iter_markdown(report)
 
-    def _export_markdown(self, report: TRIZReport) -> str:
-        """Export report in Markdown format."""
-        content = self.report_templates["header"].format(
+    def _iter_markdown(self, report: TRIZReport) -> Iterator[str]:
+        """Export report in Markdown format, one block at a time."""
+        yield self.report_templates["header"].format(
             report_id=report.report_id,
             timestamp=report.timestamp
         )
 
-        content += self.report_templates["problem_summary"].format(
+        yield self.report_templates["problem_summary"].format(
             problem_text=report.problem_summary,
             system="Not specified",
             improvement="Not specified",
@@ -492,26 +514,26 @@ class ReportBuilder:
 
         # Add all sections
         for section in report.sections:
-            content += f"## {section.title}\n\n{section.content}\n\n"
+            yield f"## {section.title}\n\n{section.content}\n\n"
 
-        content += self.report_templates["conclusions"].format(
+        yield self.report_templates["conclusions"].format(
             conclusions_list="\n".join(f"• {c}" for c in report.conclusions)
         )
 
-        content += self.report_templates["next_steps"].format(
+        yield self.report_templates["next_steps"].format(
             next_steps_list="\n".join(report.next_steps),
             report_id=report.report_id,
             timestamp=report.timestamp
         )
 
-        return content
-
     def _export_json(self, report: TRIZReport) -> str:
         """Export report in JSON format."""
         report_dict = asdict(report)
         report_dict["export_format"] = "json"
         report_dict["export_timestamp"] = datetime.now().isoformat()
 
+        if orjson is not None:
+            return orjson.dumps(report_dict, option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(report_dict, indent=2, ensure_ascii=False)
 
     def _export_html(self, report: TRIZReport) -> str:
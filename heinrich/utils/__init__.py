@@ -5,9 +5,11 @@ Common utilities for the Heinrich TRIZ Engine.
 
 from heinrich.utils.logging_config import setup_logging, get_logger
 from heinrich.utils.config_loader import ConfigLoader
+from heinrich.utils.yaml_loader import safe_load
 
 __all__ = [
     "setup_logging",
     "get_logger",
-    "ConfigLoader"
+    "ConfigLoader",
+    "safe_load"
 ]
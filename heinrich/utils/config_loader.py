@@ -4,8 +4,24 @@ Handles loading configuration from environment variables and files.
 """
 import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
-import yaml
+from heinrich.utils.yaml_loader import safe_load
+
+
+# Read-only default configuration shared by all loader instances
+_DEFAULTS = MappingProxyType({
+    "llm_provider": "ollama",
+    "log_level": "INFO",
+    "output_format": "markdown",
+    "interactive_mode": True,
+    "language": "en",
+    "enable_cache": True,
+    "cache_ttl": 3600,
+    "max_concurrent_requests": 10,
+    "request_timeout": 60,
+    "debug": False,
+})
 
 
 class ConfigLoader:
@@ -38,18 +54,7 @@ class ConfigLoader:
     
     def _load_defaults(self) -> None:
         """Load default configuration values."""
-        self.config = {
-            "llm_provider": "ollama",
-            "log_level": "INFO",
-            "output_format": "markdown",
-            "interactive_mode": True,
-            "language": "en",
-            "enable_cache": True,
-            "cache_ttl": 3600,
-            "max_concurrent_requests": 10,
-            "request_timeout": 60,
-            "debug": False,
-        }
+        self.config = dict(_DEFAULTS)
     
     def _load_from_file(self, config_file: Path) -> None:
         """
@@ -59,7 +64,7 @@ class ConfigLoader:
             config_file: Path to YAML configuration file
         """
         with open(config_file, 'r', encoding='utf-8') as f:
-            file_config = yaml.safe_load(f)
+            file_config = safe_load(f)
             if file_config:
                 self.config.update(file_config)
     
@@ -2,12 +2,35 @@
 Logging configuration for Heinrich TRIZ Engine.
 Provides consistent logging setup across the application.
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
 
+# Background listener draining queued records to the log file, and the root
+# handler feeding it; kept at module level so they are not garbage-collected
+# while the application is running and can be replaced as a pair.
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def _stop_queue_listener() -> None:
+    """Detach the queue handler, then flush and stop its listener, if any."""
+    global _queue_listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[Path] = None,
@@ -18,7 +41,8 @@ def setup_logging(
     
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Optional file path to write logs to
+        log_file: Optional file path to write logs to. Records are handed to
+            a background thread so callers never block on disk I/O.
         format_string: Optional custom format string for log messages
     """
     if format_string is None:
@@ -31,17 +55,36 @@ def setup_logging(
     
     # Configure root logger
     handlers = [logging.StreamHandler(sys.stdout)]
+    replacing = False
     
     if log_file:
+        global _queue_listener, _queue_handler
+        # A previous file setup is torn down as a whole; basicConfig then has
+        # to force past the root handlers it left behind
+        replacing = _queue_listener is not None
+        _stop_queue_listener()
+        
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(logging.Formatter(format_string))
-        handlers.append(file_handler)
+        
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        # The file handler applies the real format; only merge args here
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(queue_handler)
+        _queue_handler = queue_handler
+        
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
     
     logging.basicConfig(
         level=numeric_level,
         format=format_string,
-        handlers=handlers
+        handlers=handlers,
+        force=replacing
     )
     
     # Set library loggers to WARNING to reduce noise
@@ -49,6 +92,9 @@ def setup_logging(
     logging.getLogger("requests").setLevel(logging.WARNING)
 
 
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
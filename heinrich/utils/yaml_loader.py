@@ -0,0 +1,25 @@
+"""
+YAML loading helpers for Heinrich TRIZ Engine.
+Uses the libyaml-backed C loader when PyYAML was built with it.
+"""
+from typing import Any, IO, Union
+
+import yaml
+
+
+# CSafeLoader is only present when PyYAML was compiled against libyaml;
+# otherwise fall back to the pure-Python SafeLoader (same output, slower).
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """
+    Parse YAML like ``yaml.safe_load`` using the fastest available loader.
+    
+    Args:
+        stream: YAML document as text, bytes or an open file
+        
+    Returns:
+        Parsed Python object
+    """
+    return yaml.load(stream, Loader=SafeLoader)
@@ -4,38 +4,214 @@ Heinrich TRIZ Engine - Command Line Interface
 Interactive CLI for TRIZ-based inventive problem solving.
 """
 
+from __future__ import annotations
+
 import argparse
-import sys
+import asyncio
+import hashlib
 import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any
-
-# Import Heinrich modules
-from heinrich.pipelines.problem_parser import ProblemParser, ParsedProblem
-from heinrich.pipelines.contradiction_identifier import ContradictionIdentifier, ContradictionResult
-from heinrich.pipelines.principle_selector import PrincipleSelector, PrincipleSelectionResult
-from heinrich.pipelines.effects_lookup import EffectsLookup, EffectRecommendation
-from heinrich.pipelines.concept_generator import ConceptGenerator, ConceptGenerationResult
-from heinrich.pipelines.adaptation_planner import AdaptationPlanner, AdaptationContext, AdaptationResult
-from heinrich.pipelines.report_builder import ReportBuilder, TRIZReport
-from heinrich.agents.persona_manager import PersonaManager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Heinrich modules are imported on first use so that `--help`, API mode and
+# argument errors do not pay for loading the whole pipeline
+if TYPE_CHECKING:
+    from heinrich.agents.persona_manager import PersonaManager
+    from heinrich.pipelines.adaptation_planner import (
+        AdaptationContext,
+        AdaptationPlanner,
+        AdaptationResult,
+    )
+    from heinrich.pipelines.concept_generator import ConceptGenerationResult, ConceptGenerator
+    from heinrich.pipelines.contradiction_identifier import (
+        ContradictionIdentifier,
+        ContradictionResult,
+    )
+    from heinrich.pipelines.effects_lookup import EffectRecommendation, EffectsLookup
+    from heinrich.pipelines.principle_selector import PrincipleSelectionResult, PrincipleSelector
+    from heinrich.pipelines.problem_parser import ParsedProblem, ProblemParser
+    from heinrich.pipelines.report_builder import ReportBuilder, TRIZReport
+    from heinrich.utils.config_loader import ConfigLoader
+
+try:
+    from prompt_toolkit import prompt as toolkit_prompt
+except ImportError:
+    # prompt_toolkit is optional (``ui`` extra); fall back to built-in input()
+    toolkit_prompt = None
+
+# Write buffer for report files; reports are streamed in section-sized chunks
+REPORT_WRITE_BUFFER = 1 << 20
+
+# On-disk cache of stage outputs, shared across CLI invocations
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "heinrich"
+
+# Number of problems read from the input file and run through the pipeline together
+BATCH_SIZE = 32
+
+# Below this confidence the later stages have nothing reliable to build on
+MIN_CONTRADICTION_CONFIDENCE = 0.3
+
+# Keywords that mark input as a technical problem or improvement goal,
+# matched as substrings in a single regex pass over the lowercased text
+_PROBLEM_KEYWORDS = frozenset(
+    {"improve", "increase", "decrease", "better", "faster", "problem", "issue", "challenge"}
+)
+_PROBLEM_KEYWORD_REGEX = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_PROBLEM_KEYWORDS))
+)
+
+# Common domain keywords
+_DOMAIN_PATTERNS = {
+    "automotive": ("car", "vehicle", "engine", "transmission", "brake", "suspension"),
+    "aerospace": ("aircraft", "plane", "wing", "fuselage", "propulsion", "altitude"),
+    "medical": ("patient", "treatment", "diagnosis", "surgery", "implant", "therapy"),
+    "manufacturing": ("production", "assembly", "quality", "efficiency", "automation"),
+    "energy": ("power", "efficiency", "consumption", "renewable", "battery", "solar"),
+    "electronics": ("circuit", "signal", "processor", "memory", "display", "sensor"),
+}
+_KNOWN_DOMAINS = frozenset(_DOMAIN_PATTERNS)
+
+# Adaptation context menus:
+# (context field, menu label, prompt, options, show options title-cased)
+_ADAPTATION_QUESTIONS = (
+    (
+        "industry",
+        "🏭 Industry",
+        "Select industry",
+        ("automotive", "aerospace", "medical", "manufacturing", "energy", "electronics", "other"),
+        True,
+    ),
+    (
+        "company_size",
+        "🏢 Company Size",
+        "Select company size",
+        ("startup", "small/medium enterprise", "large enterprise"),
+        True,
+    ),
+    ("budget_level", "💰 Budget Level", "Select budget level", ("low", "medium", "high"), True),
+    (
+        "timeline",
+        "⏰ Timeline",
+        "Select timeline",
+        ("short-term (weeks)", "medium-term (months)", "long-term (quarters)"),
+        False,
+    ),
+    (
+        "technical_expertise",
+        "🎓 Technical Expertise",
+        "Select expertise level",
+        ("basic", "intermediate", "advanced"),
+        True,
+    ),
+)
+
+
+def _load_parsed_problem(data: Dict) -> ParsedProblem:
+    """Rebuild a cached problem-analysis result."""
+    from heinrich.pipelines.problem_parser import ParsedProblem
+
+    return ParsedProblem(**data)
+
+
+def _load_contradiction_result(data: Dict) -> ContradictionResult:
+    """Rebuild a cached contradiction-identification result."""
+    from heinrich.pipelines.contradiction_identifier import (
+        ContradictionResult,
+        TechnicalContradiction,
+    )
+
+    primary = data["primary_contradiction"]
+    return ContradictionResult(
+        contradictions=[TechnicalContradiction(**c) for c in data["contradictions"]],
+        primary_contradiction=TechnicalContradiction(**primary) if primary else None,
+        alternative_contradictions=[
+            TechnicalContradiction(**c) for c in data["alternative_contradictions"]
+        ],
+    )
+
+
+def _load_effects(data: List[Dict]) -> List[EffectRecommendation]:
+    """Rebuild cached scientific effect recommendations."""
+    from heinrich.pipelines.effects_lookup import EffectRecommendation, ScientificEffect
+
+    return [
+        EffectRecommendation(**{**item, "effect": ScientificEffect(**item["effect"])})
+        for item in data
+    ]
+
+
+def _build_pattern_domains() -> Dict[str, List[str]]:
+    """Map each domain pattern to every domain it signals."""
+    pattern_domains: Dict[str, List[str]] = {}
+    for domain, patterns in _DOMAIN_PATTERNS.items():
+        for pattern in patterns:
+            pattern_domains.setdefault(pattern, []).append(domain)
+    return pattern_domains
+
+
+_PATTERN_DOMAINS = _build_pattern_domains()
+
+# One alternation over all patterns; the lookahead reports every start
+# position so overlapping substring hits are found in a single scan
+_DOMAIN_REGEX = re.compile(
+    "(?=(" + "|".join(re.escape(pattern) for pattern in _PATTERN_DOMAINS) + "))"
+)
+
 
 class HeinrichCLI:
     """Command-line interface for the Heinrich TRIZ Engine."""
 
+    _HEADER = (
+        "🚀" + "=" * 70 + "🚀\n"
+        "           Heinrich: The Inventing Machine\n"
+        "   AI-Powered TRIZ Methodology for Systematic Innovation\n" + "=" * 72 + "\n"
+        "Version 0.1.0 | Inspired by Genrich Altshuller's TRIZ\n" + "=" * 72 + "\n\n"
+    )
+
+    _PROBLEM_INPUT_INTRO = (
+        "\n📝 STEP 1: Problem Description\n" + "-" * 40 + "\n"
+        "Please describe your technical problem or challenge.\n"
+        "Be specific about:\n"
+        "• What system or product you're working with\n"
+        "• What you want to improve\n"
+        "• What constraints or limitations you're facing\n"
+        "\n"
+    )
+
+    _HELP_TEXT = """Heinrich: The Inventing Machine - Help
+==================================================
+
+DESCRIPTION:
+    AI-powered TRIZ engine for systematic inventive problem solving
+
+MODES:
+    interactive  - Interactive problem-solving session
+    batch       - Process multiple problems from file
+    api         - Start API server for programmatic access
+
+TRIZ METHODOLOGY:
+    Uses Genrich Altshuller's 39 parameters and 40 principles
+    Integrates scientific effects for concrete solutions
+    Adapts solutions to specific organizational contexts
+
+EXAMPLES:
+    heinrich interactive
+    heinrich batch problems.txt
+    heinrich api --port 8080
+"""
+
     def __init__(self):
         """Initialize the CLI with all necessary components."""
-        self.persona_manager = PersonaManager()
-        self.problem_parser = ProblemParser()
-        self.contradiction_identifier = ContradictionIdentifier()
-        self.principle_selector = PrincipleSelector()
-        self.effects_lookup = EffectsLookup()
-        self.concept_generator = ConceptGenerator()
-        self.adaptation_planner = AdaptationPlanner()
-        self.report_builder = ReportBuilder()
-
         # Interactive mode state
         self.current_problem: str = ""
+        self.domain_keywords: Tuple[str, ...] = ()
         self.parsed_problem: Optional[ParsedProblem] = None
         self.contradiction_result: Optional[ContradictionResult] = None
         self.principle_results: List[PrincipleSelectionResult] = []
@@ -43,36 +219,111 @@ class HeinrichCLI:
         self.concepts: List[Dict] = []
         self.adaptation_result: Optional[AdaptationResult] = None
 
+        # Stages whose expired cache entries were already pruned
+        self._pruned_stages: Set[str] = set()
+
+    @cached_property
+    def config(self) -> ConfigLoader:
+        """Runtime configuration (cache switches), loaded on first use."""
+        from heinrich.utils.config_loader import ConfigLoader
+
+        return ConfigLoader()
+
+    @cached_property
+    def persona_manager(self) -> PersonaManager:
+        """Heinrich persona, loaded on first use."""
+        from heinrich.agents.persona_manager import PersonaManager
+
+        return PersonaManager()
+
+    @cached_property
+    def problem_parser(self) -> ProblemParser:
+        """Problem parser, loaded on first use."""
+        from heinrich.pipelines.problem_parser import ProblemParser
+
+        return ProblemParser()
+
+    @cached_property
+    def contradiction_identifier(self) -> ContradictionIdentifier:
+        """Contradiction identifier, loaded on first use."""
+        from heinrich.pipelines.contradiction_identifier import ContradictionIdentifier
+
+        return ContradictionIdentifier()
+
+    @cached_property
+    def principle_selector(self) -> PrincipleSelector:
+        """Principle selector, loaded on first use."""
+        from heinrich.pipelines.principle_selector import PrincipleSelector
+
+        return PrincipleSelector()
+
+    @cached_property
+    def effects_lookup(self) -> EffectsLookup:
+        """Scientific effects lookup, loaded on first use."""
+        from heinrich.pipelines.effects_lookup import EffectsLookup
+
+        return EffectsLookup()
+
+    @cached_property
+    def concept_generator(self) -> ConceptGenerator:
+        """Concept generator, loaded on first use."""
+        from heinrich.pipelines.concept_generator import ConceptGenerator
+
+        return ConceptGenerator()
+
+    @cached_property
+    def adaptation_planner(self) -> AdaptationPlanner:
+        """Adaptation planner, loaded on first use."""
+        from heinrich.pipelines.adaptation_planner import AdaptationPlanner
+
+        return AdaptationPlanner()
+
+    @cached_property
+    def report_builder(self) -> ReportBuilder:
+        """Report builder, loaded on first use."""
+        from heinrich.pipelines.report_builder import ReportBuilder
+
+        return ReportBuilder()
+
     def print_header(self):
         """Print the Heinrich CLI header."""
-        print("🚀" + "="*70 + "🚀")
-        print("           Heinrich: The Inventing Machine")
-        print("   AI-Powered TRIZ Methodology for Systematic Innovation")
-        print("="*72)
-        print(f"Version 0.1.0 | Inspired by Genrich Altshuller's TRIZ")
-        print("="*72 + "\n")
+        sys.stdout.write(self._HEADER)
+
+    @cached_property
+    def _session_intro(self) -> str:
+        """Greeting and session banner, rendered once from the active persona."""
+        return (
+            "🤖 " + self.persona_manager.get_greeting() + "\n\n"
+            "🎯 Interactive TRIZ Problem-Solving Session\n" + "=" * 50 + "\n"
+        )
 
     def print_persona_greeting(self):
-        """Print Heinrich's greeting."""
-        print("🤖 " + self.persona_manager.get_greeting())
-        print()
+        """Print Heinrich's greeting and the session banner."""
+        sys.stdout.write(self._session_intro)
 
     def get_user_input(self, prompt: str) -> str:
         """Get input from user with prompt."""
         try:
+            if toolkit_prompt is not None and sys.stdin.isatty():
+                return toolkit_prompt(prompt).strip()
+            sys.stdout.flush()
             return input(prompt).strip()
         except KeyboardInterrupt:
-            print("\n\n👋 Goodbye! Remember: systematic thinking leads to breakthrough innovations.")
+            print(
+                "\n\n👋 Goodbye! Remember: systematic thinking leads to breakthrough innovations."
+            )
             sys.exit(0)
 
     def run_interactive_mode(self):
-        """Run the interactive problem-solving mode."""
+        """Run the interactive problem-solving mode.
+
+        The session itself stays synchronous: prompt_toolkit's blocking
+        prompt() starts its own event loop and cannot run inside one. Only
+        the independent steps 4-5 are driven through asyncio.
+        """
         self.print_header()
         self.print_persona_greeting()
 
-        print("🎯 Interactive TRIZ Problem-Solving Session")
-        print("="*50)
-
         # Step 1: Problem Input
         self.step_problem_input()
 
@@ -82,11 +333,13 @@ class HeinrichCLI:
         # Step 3: Contradiction Identification
         self.step_contradiction_identification()
 
-        # Step 4: Principle Selection
-        self.step_principle_selection()
+        # Stop early when there is no contradiction worth solving
+        if not self._has_confident_contradiction(self.contradiction_result):
+            self.show_low_confidence_summary()
+            return
 
-        # Step 5: Effects Integration
-        self.step_effects_integration()
+        # Steps 4-5: Principle Selection and Effects Integration
+        asyncio.run(self.step_principles_and_effects())
 
         # Step 6: Concept Generation
         self.step_concept_generation()
@@ -102,31 +355,26 @@ class HeinrichCLI:
 
     def step_problem_input(self):
         """Step 1: Get problem description from user."""
-        print("\n📝 STEP 1: Problem Description")
-        print("-" * 40)
-
-        print("Please describe your technical problem or challenge.")
-        print("Be specific about:")
-        print("• What system or product you're working with")
-        print("• What you want to improve")
-        print("• What constraints or limitations you're facing")
-        print()
+        sys.stdout.write(self._PROBLEM_INPUT_INTRO)
 
         while True:
             problem_text = self.get_user_input("Your problem: ")
 
             if len(problem_text.strip()) < 20:
-                print("❌ Please provide a more detailed problem description (at least 20 characters).")
+                print(
+                    "❌ Please provide a more detailed problem description (at least 20 characters)."
+                )
                 continue
 
-            if not any(keyword in problem_text.lower() for keyword in
-                      ["improve", "increase", "decrease", "better", "faster", "problem", "issue", "challenge"]):
+            problem_lower = problem_text.lower()
+            if not _PROBLEM_KEYWORD_REGEX.search(problem_lower):
                 print("❌ Please describe a technical problem or improvement goal.")
                 continue
 
             break
 
         self.current_problem = problem_text
+        self.domain_keywords = self._extract_domain_keywords(problem_lower)
         print(f"\n✅ Problem received: {len(problem_text)} characters")
         print(f"📋 Summary: {problem_text[:100]}{'...' if len(problem_text) > 100 else ''}")
 
@@ -136,11 +384,18 @@ class HeinrichCLI:
         print("-" * 40)
 
         print("🤖 Analyzing your problem using TRIZ methodology...")
-        self.parsed_problem = self.problem_parser.parse(self.current_problem)
+        self.parsed_problem = self._cached(
+            "parse",
+            self.current_problem,
+            lambda: self.problem_parser.parse(self.current_problem),
+            _load_parsed_problem,
+        )
 
         print("✅ Analysis complete!")
         print(f"📊 Technical System: {self.parsed_problem.technical_system or 'Not identified'}")
-        print(f"🎯 Desired Improvement: {self.parsed_problem.desired_improvement or 'Not identified'}")
+        print(
+            f"🎯 Desired Improvement: {self.parsed_problem.desired_improvement or 'Not identified'}"
+        )
         print(f"⚠️  Constraints: {len(self.parsed_problem.constraints)} identified")
 
     def step_contradiction_identification(self):
@@ -149,36 +404,101 @@ class HeinrichCLI:
         print("-" * 40)
 
         print("🤖 Identifying technical contradictions using 39 TRIZ parameters...")
-        self.contradiction_result = self.contradiction_identifier.identify_contradiction(self.current_problem)
+        self.contradiction_result = self._cached(
+            "contradiction",
+            self.current_problem,
+            lambda: self.contradiction_identifier.identify_contradiction(self.current_problem),
+            _load_contradiction_result,
+            sources=("heinrich/knowledge/39_parameters.yaml",),
+        )
 
         print("✅ Contradiction analysis complete!")
 
         if self.contradiction_result.primary_contradiction:
             primary = self.contradiction_result.primary_contradiction
-            print(f"🎯 Primary Contradiction: {primary.improving_parameter_name} vs {primary.worsening_parameter_name}")
+            print(
+                f"🎯 Primary Contradiction: {primary.improving_parameter_name} vs {primary.worsening_parameter_name}"
+            )
             print(f"📊 Confidence: {primary.confidence_score:.1%}")
             print(f"💡 Reasoning: {primary.reasoning}")
 
             if self.contradiction_result.alternative_contradictions:
-                print(f"🔄 {len(self.contradiction_result.alternative_contradictions)} alternative contradictions identified")
+                print(
+                    f"🔄 {len(self.contradiction_result.alternative_contradictions)} alternative contradictions identified"
+                )
         else:
-            print("⚠️  No clear technical contradiction identified. Proceeding with general analysis.")
+            print("⚠️  No clear technical contradiction identified.")
+
+    def show_low_confidence_summary(self):
+        """Explain why the session stopped after contradiction identification."""
+        print("\n⏹️  Stopping early: no confident technical contradiction was found.")
+        print(
+            f"   Steps 4-8 need a contradiction with at least {MIN_CONTRADICTION_CONFIDENCE:.0%} confidence."
+        )
+        print('💡 Try restating the problem as "improve X, but Y gets worse",')
+        print("   naming both the parameter you want to improve and the one that degrades.")
+
+    def _has_confident_contradiction(self, contradiction_result: ContradictionResult) -> bool:
+        """Check whether the later pipeline stages are worth running."""
+        primary = contradiction_result.primary_contradiction
+        return primary is not None and primary.confidence_score >= MIN_CONTRADICTION_CONFIDENCE
 
     def step_principle_selection(self):
         """Step 4: Select relevant TRIZ principles."""
-        print("\n⚡ STEP 4: TRIZ Principle Selection")
-        print("-" * 40)
+        self._select_principles()
+        self._show_principle_selection()
 
-        if self.contradiction_result.primary_contradiction:
-            print("🤖 Selecting principles from the 40 TRIZ inventive principles...")
-            primary = self.contradiction_result.primary_contradiction
+    def step_effects_integration(self):
+        """Step 5: Integrate scientific effects."""
+        self._find_effects()
+        self._show_effects_integration()
+
+    async def step_principles_and_effects(self):
+        """Steps 4-5: Select principles and look up effects concurrently.
+
+        Both stages depend only on the identified contradiction, so they run
+        side by side in worker threads; results are printed in step order.
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            loop.run_in_executor(None, self._select_principles),
+            loop.run_in_executor(None, self._find_effects),
+        )
+        self._show_principle_selection()
+        self._show_effects_integration()
 
+    def _select_principles(self):
+        """Run principle selection for the primary contradiction."""
+        primary = self.contradiction_result.primary_contradiction
+        if primary:
             result = self.principle_selector.select_principles(
-                primary.improving_parameter,
-                primary.worsening_parameter
+                primary.improving_parameter, primary.worsening_parameter
             )
             self.principle_results = [result]
 
+    def _find_effects(self):
+        """Run the scientific effects lookup for the primary contradiction."""
+        primary = self.contradiction_result.primary_contradiction
+        if primary:
+            self.effects = self._cached(
+                "effects",
+                f"{primary.improving_parameter}|{primary.worsening_parameter}|{','.join(self.domain_keywords)}",
+                lambda: self.effects_lookup.find_effects_for_contradiction(
+                    primary.improving_parameter, primary.worsening_parameter, self.domain_keywords
+                ),
+                _load_effects,
+                sources=("heinrich/knowledge/effects_database.json",),
+            )
+
+    def _show_principle_selection(self):
+        """Print the outcome of step 4."""
+        print("\n⚡ STEP 4: TRIZ Principle Selection")
+        print("-" * 40)
+
+        if self.contradiction_result.primary_contradiction:
+            print("🤖 Selecting principles from the 40 TRIZ inventive principles...")
+            result = self.principle_results[0]
+
             print("✅ Principle selection complete!")
             print(f"📚 Primary Principles: {len(result.primary_principles)}")
             print(f"🔧 Supporting Principles: {len(result.supporting_principles)}")
@@ -190,24 +510,14 @@ class HeinrichCLI:
             print("⚠️  No primary contradiction available. Using general principle selection.")
             # Could implement fallback logic here
 
-    def step_effects_integration(self):
-        """Step 5: Integrate scientific effects."""
+    def _show_effects_integration(self):
+        """Print the outcome of step 5."""
         print("\n🔬 STEP 5: Scientific Effects Integration")
         print("-" * 40)
 
         print("🤖 Finding relevant scientific effects and technical knowledge...")
 
-        # Get domain keywords from problem
-        domain_keywords = self._extract_domain_keywords(self.current_problem)
-
         if self.contradiction_result.primary_contradiction:
-            primary = self.contradiction_result.primary_contradiction
-            self.effects = self.effects_lookup.find_effects_for_contradiction(
-                primary.improving_parameter,
-                primary.worsening_parameter,
-                domain_keywords
-            )
-
             print("✅ Effects analysis complete!")
             print(f"🔍 Found {len(self.effects)} relevant scientific effects")
 
@@ -226,48 +536,17 @@ class HeinrichCLI:
         print("🤖 Generating concrete solution concepts...")
 
         if self.principle_results and self.effects:
-            # Convert principle results to the format expected by concept generator
-            principles_data = []
-            for result in self.principle_results:
-                for principle in result.primary_principles + result.supporting_principles:
-                    principles_data.append({
-                        'id': principle.principle_id,
-                        'name': principle.principle_name,
-                        'description': principle.principle_description
-                    })
-
-            # Convert effects to the format expected by concept generator
-            effects_data = []
-            for effect in self.effects[:5]:  # Limit to top 5 effects
-                effects_data.append({
-                    'id': effect.effect.id,
-                    'name': effect.effect.name,
-                    'category': effect.effect.category,
-                    'technical_domains': effect.effect.technical_domains,
-                    'applications': effect.effect.applications
-                })
-
-            # Generate concepts
             generation_result = self.concept_generator.generate_concepts(
-                principles_data,
-                effects_data,
-                {"technical_system": self.parsed_problem.technical_system if self.parsed_problem else "Unknown"}
+                self._principles_to_dicts(self.principle_results),
+                self._effects_to_dicts(self.effects),
+                {
+                    "technical_system": (
+                        self.parsed_problem.technical_system if self.parsed_problem else "Unknown"
+                    )
+                },
             )
 
-            self.concepts = []
-            for concept in generation_result.concepts:
-                self.concepts.append({
-                    'concept_id': concept.concept_id,
-                    'title': concept.title,
-                    'description': concept.description,
-                    'principles_used': concept.principles_used,
-                    'effects_used': concept.effects_used,
-                    'advantages': concept.advantages,
-                    'implementation_steps': concept.implementation_steps,
-                    'estimated_complexity': concept.estimated_complexity,
-                    'innovation_level': concept.innovation_level,
-                    'domain_applications': concept.domain_applications
-                })
+            self.concepts = self._concepts_to_dicts(generation_result)
 
             print("✅ Concept generation complete!")
             print(f"🚀 Generated {len(self.concepts)} solution concepts")
@@ -291,21 +570,8 @@ class HeinrichCLI:
         if self.concepts:
             print("🤖 Adapting concepts to your specific context...")
 
-            # Convert concepts to format expected by adaptation planner
-            concepts_data = []
-            for concept in self.concepts:
-                concepts_data.append({
-                    'concept_id': concept['concept_id'],
-                    'title': concept['title'],
-                    'description': concept['description'],
-                    'estimated_complexity': concept['estimated_complexity'],
-                    'innovation_level': concept['innovation_level']
-                })
-
             adaptation_result = self.adaptation_planner.adapt_concepts(
-                concepts_data[:3],  # Limit to top 3 concepts
-                context,
-                num_adaptations=2
+                self.concepts[:3], context, num_adaptations=2  # Limit to top 3 concepts
             )
 
             self.adaptation_result = adaptation_result
@@ -327,173 +593,473 @@ class HeinrichCLI:
 
         print("🤖 Generating comprehensive TRIZ analysis report...")
 
-        if (self.contradiction_result and self.principle_results and
-            self.effects and self.concepts and self.adaptation_result):
+        if (
+            self.contradiction_result
+            and self.principle_results
+            and self.effects
+            and self.concepts
+            and self.adaptation_result
+        ):
 
-            # Generate the report
-            report = self.report_builder.build_report(
+            report = self._build_report(
                 self.current_problem,
-                {"primary_contradiction": self.contradiction_result.primary_contradiction},
-                [result.__dict__ for result in self.principle_results],
-                [effect.__dict__ for effect in self.effects],
+                self.contradiction_result,
+                self.principle_results,
+                self.effects,
                 self.concepts,
-                self.adaptation_result.__dict__
+                self.adaptation_result,
             )
+            report_filename = self._write_report(report, Path("."))
 
-            # Save report to file
-            report_filename = f"heinrich_report_{report.report_id}.md"
-            with open(report_filename, 'w', encoding='utf-8') as f:
-                f.write(self.report_builder.export_report(report, "markdown"))
-
-            print("✅ Report generated successfully!"            print(f"📄 Saved as: {report_filename}")
+            print("✅ Report generated successfully!")
+            print(f"📄 Saved as: {report_filename}")
             print(f"🆔 Report ID: {report.report_id}")
 
             # Show report summary
-            print("
-📋 Report Summary:"            print(f"   • {len(report.sections)} analysis sections")
+            print("\n📋 Report Summary:")
+            print(f"   • {len(report.sections)} analysis sections")
             print(f"   • {len(report.conclusions)} key conclusions")
             print(f"   • {len(report.next_steps)} recommended next steps")
 
         else:
             print("⚠️  Insufficient data for report generation.")
 
-    def _extract_domain_keywords(self, problem_text: str) -> List[str]:
-        """Extract domain-specific keywords from problem text."""
-        keywords = []
-
-        # Common domain keywords
-        domain_patterns = {
-            "automotive": ["car", "vehicle", "engine", "transmission", "brake", "suspension"],
-            "aerospace": ["aircraft", "plane", "wing", "fuselage", "propulsion", "altitude"],
-            "medical": ["patient", "treatment", "diagnosis", "surgery", "implant", "therapy"],
-            "manufacturing": ["production", "assembly", "quality", "efficiency", "automation"],
-            "energy": ["power", "efficiency", "consumption", "renewable", "battery", "solar"],
-            "electronics": ["circuit", "signal", "processor", "memory", "display", "sensor"]
-        }
-
-        text_lower = problem_text.lower()
+    def _cached(
+        self,
+        stage_name: str,
+        key: str,
+        compute: Callable[[], Any],
+        load: Callable[[Any], Any],
+        sources: Tuple[str, ...] = (),
+    ) -> Any:
+        """
+        Return a stage result from the on-disk cache, computing it on a miss.
+
+        Results are stored as JSON and rebuilt with ``load``. Entries are keyed
+        on the stage name, package version, the mtimes of the knowledge files
+        in ``sources`` and a SHA-1 of the stage input, and expire after
+        ``cache_ttl`` seconds. The first lookup of a stage deletes its expired
+        entries, including ones left under outdated keys. Caching is skipped
+        entirely when ``enable_cache`` is off.
+        """
+        if not self.config.get("enable_cache", True):
+            return compute()
 
-        for domain, patterns in domain_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                keywords.append(domain)
-                keywords.extend(patterns[:2])  # Add top 2 matching patterns
+        from heinrich.version import __version__
 
-        return keywords[:5]  # Limit to 5 keywords
+        mtimes = []
+        for source in sources:
+            try:
+                mtimes.append(str(os.stat(source).st_mtime_ns))
+            except OSError:
+                mtimes.append("-")
+        digest = hashlib.sha1("\0".join([__version__, *mtimes, key]).encode("utf-8")).hexdigest()
+        cache_file = CACHE_DIR / f"{stage_name}_{digest}.json"
 
-    def _collect_adaptation_context(self) -> AdaptationContext:
-        """Collect context information for adaptation."""
-        print("\n📋 Please provide some context for solution adaptation:")
+        ttl = self.config.get("cache_ttl", 3600)
+        if stage_name not in self._pruned_stages:
+            self._pruned_stages.add(stage_name)
+            self._prune_stage_cache(stage_name, ttl)
 
-        # Industry
-        industries = ["automotive", "aerospace", "medical", "manufacturing", "energy", "electronics", "other"]
-        print("\n🏭 Industry:")
-        for i, industry in enumerate(industries, 1):
-            print(f"  {i}. {industry.title()}")
+        try:
+            if time.time() - cache_file.stat().st_mtime < ttl:
+                return load(json.loads(cache_file.read_bytes()))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, corrupt or mis-shaped entry: recompute and overwrite
 
-        while True:
-            choice = self.get_user_input("Select industry (1-7): ")
+        result = compute()
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(result, default=asdict), encoding="utf-8")
+        except (OSError, TypeError, ValueError):
+            pass  # Caching is best effort
+        return result
+
+    def _prune_stage_cache(self, stage_name: str, ttl: float):
+        """Delete a stage's cache entries older than ``ttl`` seconds."""
+        cutoff = time.time() - ttl
+        for cache_file in CACHE_DIR.glob(f"{stage_name}_*"):
             try:
-                industry_idx = int(choice) - 1
-                if 0 <= industry_idx < len(industries):
-                    industry = industries[industry_idx]
-                    break
-                else:
-                    print("❌ Please select a valid option.")
-            except ValueError:
-                print("❌ Please enter a number.")
+                if cache_file.stat().st_mtime < cutoff:
+                    cache_file.unlink()
+            except OSError:
+                pass  # Removed concurrently or not ours to delete
+
+    def _principles_to_dicts(self, principle_results: List[PrincipleSelectionResult]) -> List[Dict]:
+        """Convert principle results to the format expected by the concept generator."""
+        return [
+            {
+                "id": principle.principle_id,
+                "name": principle.principle_name,
+                "description": principle.principle_description,
+            }
+            for result in principle_results
+            for principle in result.primary_principles + result.supporting_principles
+        ]
+
+    def _effects_to_dicts(self, effects: List[EffectRecommendation]) -> List[Dict]:
+        """Convert effects to the format expected by the concept generator."""
+        return [
+            {
+                "id": effect.effect.id,
+                "name": effect.effect.name,
+                "category": effect.effect.category,
+                "technical_domains": effect.effect.technical_domains,
+                "applications": effect.effect.applications,
+            }
+            for effect in effects[:5]  # Limit to top 5 effects
+        ]
+
+    def _concepts_to_dicts(self, generation_result: ConceptGenerationResult) -> List[Dict]:
+        """
+        Flatten generated concepts into the dictionaries kept as CLI state.
 
-        # Company size
-        print("\n🏢 Company Size:")
-        sizes = ["startup", "small/medium enterprise", "large enterprise"]
-        for i, size in enumerate(sizes, 1):
-            print(f"  {i}. {size.title()}")
+        The same dictionaries are handed to the adaptation planner, which
+        reads only the keys it needs.
+        """
+        return [
+            {
+                "concept_id": concept.concept_id,
+                "title": concept.title,
+                "description": concept.description,
+                "principles_used": concept.principles_used,
+                "effects_used": concept.effects_used,
+                "advantages": concept.advantages,
+                "implementation_steps": concept.implementation_steps,
+                "estimated_complexity": concept.estimated_complexity,
+                "innovation_level": concept.innovation_level,
+                "domain_applications": concept.domain_applications,
+            }
+            for concept in generation_result.concepts
+        ]
+
+    def _build_report(
+        self,
+        problem_text: str,
+        contradiction_result: ContradictionResult,
+        principle_results: List[PrincipleSelectionResult],
+        effects: List[EffectRecommendation],
+        concepts: List[Dict],
+        adaptation_result: AdaptationResult,
+    ) -> TRIZReport:
+        """Build a TRIZ report from the results of all pipeline stages."""
+        return self.report_builder.build_report(
+            problem_text,
+            asdict(contradiction_result),
+            list(map(asdict, principle_results)),
+            # The report expects each effect flattened with its relevance score
+            [
+                {**asdict(effect.effect), "relevance_score": effect.relevance_score}
+                for effect in effects
+            ],
+            concepts,
+            asdict(adaptation_result),
+        )
 
-        while True:
-            choice = self.get_user_input("Select company size (1-3): ")
-            try:
-                size_idx = int(choice) - 1
-                if 0 <= size_idx < len(sizes):
-                    company_size = sizes[size_idx]
-                    break
-                else:
-                    print("❌ Please select a valid option.")
-            except ValueError:
-                print("❌ Please enter a number.")
+    def _write_report(self, report: TRIZReport, output_dir: Path, suffix: str = "") -> str:
+        """Save a report as markdown and return the file name."""
+        report_filename = str(output_dir / f"heinrich_report_{report.report_id}{suffix}.md")
+        with open(report_filename, "w", encoding="utf-8", buffering=REPORT_WRITE_BUFFER) as f:
+            f.writelines(self.report_builder.iter_export_report(report, "markdown"))
+        return report_filename
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _extract_domain_keywords(text_lower: str) -> Tuple[str, ...]:
+        """Extract domain-specific keywords from lowercased problem text (memoized per text)."""
+        keywords = []
 
-        # Budget level
-        print("\n💰 Budget Level:")
-        budgets = ["low", "medium", "high"]
-        for i, budget in enumerate(budgets, 1):
-            print(f"  {i}. {budget.title()}")
+        matched_domains = {
+            domain
+            for match in _DOMAIN_REGEX.finditer(text_lower)
+            for domain in _PATTERN_DOMAINS[match.group(1)]
+        }
 
-        while True:
-            choice = self.get_user_input("Select budget level (1-3): ")
-            try:
-                budget_idx = int(choice) - 1
-                if 0 <= budget_idx < len(budgets):
-                    budget_level = budgets[budget_idx]
-                    break
-                else:
-                    print("❌ Please select a valid option.")
-            except ValueError:
-                print("❌ Please enter a number.")
+        for domain, patterns in _DOMAIN_PATTERNS.items():
+            if domain in matched_domains:
+                keywords.append(domain)
+                keywords.extend(patterns[:2])  # Add top 2 matching patterns
 
-        # Timeline
-        print("\n⏰ Timeline:")
-        timelines = ["short-term (weeks)", "medium-term (months)", "long-term (quarters)"]
-        for i, timeline in enumerate(timelines, 1):
-            print(f"  {i}. {timeline}")
+        return tuple(keywords[:5])  # Limit to 5 keywords
+
+    def _choose(
+        self, label: str, prompt: str, options: Tuple[str, ...], title_case: bool = True
+    ) -> str:
+        """Show a numbered menu and return the option the user picks."""
+        shown = [option.title() for option in options] if title_case else options
+        sys.stdout.write(
+            f"\n{label}:\n" + "".join(f"  {i}. {option}\n" for i, option in enumerate(shown, 1))
+        )
 
         while True:
-            choice = self.get_user_input("Select timeline (1-3): ")
+            choice = self.get_user_input(f"{prompt} (1-{len(options)}): ")
             try:
-                timeline_idx = int(choice) - 1
-                if 0 <= timeline_idx < len(timelines):
-                    timeline = timelines[timeline_idx].split()[0]  # Extract "short-term", etc.
-                    break
-                else:
-                    print("❌ Please select a valid option.")
+                idx = int(choice) - 1
             except ValueError:
                 print("❌ Please enter a number.")
+                continue
+            if 0 <= idx < len(options):
+                return options[idx]
+            print("❌ Please select a valid option.")
+
+    def _collect_adaptation_context(self) -> AdaptationContext:
+        """Collect context information for adaptation."""
+        print("\n📋 Please provide some context for solution adaptation:")
 
-        # Technical expertise
-        print("\n🎓 Technical Expertise:")
-        expertises = ["basic", "intermediate", "advanced"]
-        for i, expertise in enumerate(expertises, 1):
-            print(f"  {i}. {expertise.title()}")
+        from heinrich.pipelines.adaptation_planner import AdaptationContext
 
-        while True:
-            choice = self.get_user_input("Select expertise level (1-3): ")
-            try:
-                expertise_idx = int(choice) - 1
-                if 0 <= expertise_idx < len(expertises):
-                    technical_expertise = expertises[expertise_idx]
-                    break
-                else:
-                    print("❌ Please select a valid option.")
-            except ValueError:
-                print("❌ Please enter a number.")
+        answers = {
+            field: self._choose(label, prompt, options, title_case)
+            for field, label, prompt, options, title_case in _ADAPTATION_QUESTIONS
+        }
 
         return AdaptationContext(
-            industry=industry,
-            company_size=company_size,
-            budget_level=budget_level,
-            timeline=timeline,
-            technical_expertise=technical_expertise,
+            industry=answers["industry"],
+            company_size=answers["company_size"],
+            budget_level=answers["budget_level"],
+            timeline=answers["timeline"].split()[0],  # Extract "short-term", etc.
+            technical_expertise=answers["technical_expertise"],
             risk_tolerance="moderate",  # Default value
             existing_infrastructure=[],  # Could be expanded
-            regulatory_constraints=[],   # Could be expanded
-            market_requirements=[]       # Could be expanded
+            regulatory_constraints=[],  # Could be expanded
+            market_requirements=[],  # Could be expanded
+        )
+
+    def _default_adaptation_context(self, domain_keywords: Tuple[str, ...]) -> AdaptationContext:
+        """Build a non-interactive adaptation context for batch processing."""
+        from heinrich.pipelines.adaptation_planner import AdaptationContext
+
+        industry = next((kw for kw in domain_keywords if kw in _KNOWN_DOMAINS), "other")
+
+        return AdaptationContext(
+            industry=industry,
+            company_size="small/medium enterprise",
+            budget_level="medium",
+            timeline="medium-term",
+            technical_expertise="intermediate",
+            risk_tolerance="moderate",
+            existing_infrastructure=[],
+            regulatory_constraints=[],
+            market_requirements=[],
         )
 
+    def _iter_problem_batches(
+        self, input_file: str, batch_size: int = BATCH_SIZE
+    ) -> Iterator[List[str]]:
+        """Yield the non-empty lines of the input file in lists of ``batch_size``."""
+        batch: List[str] = []
+        with open(input_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    batch.append(line)
+                    if len(batch) == batch_size:
+                        yield batch
+                        batch = []
+        if batch:
+            yield batch
+
     def run_batch_mode(self, input_file: str, output_dir: str = "."):
-        """Run batch processing mode."""
+        """
+        Run batch processing mode.
+
+        Each non-empty line of the input file is treated as one problem.
+        Problems are streamed from the file in batches of BATCH_SIZE; the
+        batched stages (parsing, contradiction identification, principle
+        selection) are fed a whole batch before the next stage runs, and
+        the next batch is read while the current one is processed. One
+        markdown report is written per problem; a problem that fails at any
+        stage is reported and skipped without affecting the others.
+        """
         print("🔄 Batch Processing Mode")
         print(f"📂 Input file: {input_file}")
         print(f"📁 Output directory: {output_dir}")
 
-        # This would implement batch processing logic
-        print("⚠️  Batch mode not yet implemented in this version.")
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        total = 0
+        report_jobs: List[Tuple[int, Future]] = []
+        batches = self._iter_problem_batches(input_file)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as reader, ThreadPoolExecutor() as writer:
+                pending = reader.submit(next, batches, None)
+                while True:
+                    problems = pending.result()
+                    if problems is None:
+                        break
+                    # Read ahead while this batch goes through the pipeline
+                    pending = reader.submit(next, batches, None)
+
+                    print(f"📋 Processing problems {total + 1}-{total + len(problems)}")
+                    report_jobs.extend(
+                        self._process_batch(problems, total + 1, output_path, writer)
+                    )
+                    total += len(problems)
+        finally:
+            batches.close()
+
+        if not total:
+            print("⚠️  No problems found in input file.")
+            return
+
+        written = 0
+        for number, job in report_jobs:
+            try:
+                report_filename = job.result()
+            except Exception as e:
+                print(f"❌ Problem {number}: writing report failed: {e}")
+                continue
+            written += 1
+            print(f"✅ Problem {number}: saved as {report_filename}")
+
+        print(f"\n🎉 Batch complete! {written}/{total} reports generated.")
+
+    def _process_batch(
+        self, problems: List[str], first_number: int, output_path: Path, writer: ThreadPoolExecutor
+    ) -> List[Tuple[int, Future]]:
+        """
+        Run one batch of problems through the pipeline and queue their reports.
+
+        Args:
+            problems: Problem descriptions in this batch
+            first_number: 1-based number of the first problem, used in messages and file names
+            output_path: Directory the reports are written to
+            writer: Executor that exports and writes the report files
+
+        Returns:
+            (problem number, future resolving to the report file name) per queued report
+        """
+        # Problem index -> error; a failing problem only loses its own report
+        failed: Dict[int, Exception] = {}
+
+        # Steps 2-3: parse and identify contradictions for the whole batch
+        indices = list(range(len(problems)))
+        parsed_problems = self._run_batch_stage(
+            self.problem_parser.parse_batch, problems, indices, failed
+        )
+        contradiction_results = self._run_batch_stage(
+            self.contradiction_identifier.identify_contradiction_batch, problems, indices, failed
+        )
+        domain_keywords = [self._extract_domain_keywords(problem.lower()) for problem in problems]
+
+        solvable = []
+        for i, result in enumerate(contradiction_results):
+            if i in failed:
+                continue
+            if self._has_confident_contradiction(result):
+                solvable.append(i)
+            else:
+                print(
+                    f"⚠️  Problem {first_number + i}: no confident technical contradiction identified, skipped."
+                )
+
+        # Step 4: principle selection
+        principle_results = self._run_batch_stage(
+            self.principle_selector.select_principles_for_contradictions,
+            [asdict(contradiction_results[i].primary_contradiction) for i in solvable],
+            solvable,
+            failed,
+        )
+
+        # Steps 5-8 run per problem; reports are exported and written in the background
+        report_jobs = []
+        for i, principle_result in zip(solvable, principle_results):
+            if i in failed:
+                continue
+            number = first_number + i
+            try:
+                report = self._solve_batch_problem(
+                    problems[i],
+                    parsed_problems[i],
+                    contradiction_results[i],
+                    principle_result,
+                    domain_keywords[i],
+                )
+            except Exception as e:
+                failed[i] = e
+                continue
+            report_jobs.append(
+                (number, writer.submit(self._write_report, report, output_path, f"_{number:03d}"))
+            )
+
+        for i, error in sorted(failed.items()):
+            print(f"❌ Problem {first_number + i}: analysis failed: {error}")
+
+        return report_jobs
+
+    @staticmethod
+    def _run_batch_stage(
+        stage: Callable[[List[Any]], List[Any]],
+        items: List[Any],
+        indices: List[int],
+        failed: Dict[int, Exception],
+    ) -> List[Any]:
+        """
+        Run a batched pipeline stage, isolating the items that make it fail.
+
+        The whole batch is tried first. If that raises, the items are rerun
+        one at a time; an item that still fails gets ``None`` as its result
+        and its error is recorded in ``failed`` under its problem index.
+
+        Args:
+            stage: Batch method taking and returning one entry per item
+            items: Stage input, one entry per problem
+            indices: Problem index of each item
+            failed: Problem index -> error, updated in place
+
+        Returns:
+            Stage results, one per item
+        """
+        try:
+            return stage(items)
+        except Exception:
+            pass
+
+        results = []
+        for index, item in zip(indices, items):
+            try:
+                results.append(stage([item])[0])
+            except Exception as e:
+                failed.setdefault(index, e)
+                results.append(None)
+        return results
+
+    def _solve_batch_problem(
+        self,
+        problem: str,
+        parsed_problem: ParsedProblem,
+        contradiction_result: ContradictionResult,
+        principle_result: PrincipleSelectionResult,
+        domain_keywords: Tuple[str, ...],
+    ) -> TRIZReport:
+        """Run steps 5-8 for one batch problem and return its report."""
+        primary = contradiction_result.primary_contradiction
+
+        # Step 5: scientific effects
+        effects = self.effects_lookup.find_effects_for_contradiction(
+            primary.improving_parameter, primary.worsening_parameter, domain_keywords
+        )
+
+        # Step 6: concept generation
+        generation_result = self.concept_generator.generate_concepts(
+            self._principles_to_dicts([principle_result]),
+            self._effects_to_dicts(effects),
+            {"technical_system": parsed_problem.technical_system or "Unknown"},
+        )
+        concepts = self._concepts_to_dicts(generation_result)
+
+        # Step 7: context adaptation with a default context
+        adaptation_result = self.adaptation_planner.adapt_concepts(
+            concepts[:3],
+            self._default_adaptation_context(domain_keywords),
+            num_adaptations=2,
+        )
+
+        # Step 8: report
+        return self._build_report(
+            problem, contradiction_result, [principle_result], effects, concepts, adaptation_result
+        )
 
     def run_api_mode(self, host: str = "localhost", port: int = 8000):
         """Run API server mode."""
@@ -506,26 +1072,8 @@ class HeinrichCLI:
 
     def show_help(self):
         """Show help information."""
-        print("Heinrich: The Inventing Machine - Help")
-        print("="*50)
-        print()
-        print("DESCRIPTION:")
-        print("    AI-powered TRIZ engine for systematic inventive problem solving")
-        print()
-        print("MODES:")
-        print("    interactive  - Interactive problem-solving session")
-        print("    batch       - Process multiple problems from file")
-        print("    api         - Start API server for programmatic access")
-        print()
-        print("TRIZ METHODOLOGY:")
-        print("    Uses Genrich Altshuller's 39 parameters and 40 principles")
-        print("    Integrates scientific effects for concrete solutions")
-        print("    Adapts solutions to specific organizational contexts")
-        print()
-        print("EXAMPLES:")
-        print("    heinrich interactive")
-        print("    heinrich batch problems.txt")
-        print("    heinrich api --port 8080")
+        sys.stdout.write(self._HELP_TEXT)
+
 
 def main():
     """Main CLI entry point."""
@@ -537,36 +1085,25 @@ Examples:
   heinrich interactive              # Start interactive session
   heinrich batch problems.txt       # Process problems from file
   heinrich api --port 8080         # Start API server
-        """
+        """,
     )
 
-    parser.add_argument(
-        "mode",
-        choices=["interactive", "batch", "api"],
-        help="Operating mode"
-    )
+    parser.add_argument("mode", choices=["interactive", "batch", "api"], help="Operating mode")
 
     parser.add_argument(
-        "input",
-        nargs="?",
-        help="Input file (for batch mode) or host (for API mode)"
+        "input", nargs="?", help="Input file (for batch mode) or host (for API mode)"
     )
 
-    parser.add_argument(
-        "-p", "--port",
-        type=int,
-        default=8000,
-        help="Port number (for API mode)"
-    )
+    parser.add_argument("-p", "--port", type=int, default=8000, help="Port number (for API mode)")
 
-    parser.add_argument(
-        "-o", "--output",
-        default=".",
-        help="Output directory"
-    )
+    parser.add_argument("-o", "--output", default=".", help="Output directory")
 
     args = parser.parse_args()
 
+    # Push prompts and progress lines straight to the terminal
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(write_through=True)
+
     # Create CLI instance
     cli = HeinrichCLI()
 
@@ -584,5 +1121,6 @@ Examples:
         print(f"❌ Error: {e}")
         sys.exit(1)
 
+
 if __name__ == "__main__":
     main()
@@ -12,13 +12,75 @@ This script manages translation synchronization across multiple languages:
 
 import os
 import sys
-import yaml
-import hashlib
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Tuple
-import json
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+# Heavier modules (yaml, concurrent.futures, hashlib, json/orjson)
+# are imported where they are used so `--help` and argument errors return
+# without paying for them
+
+
+def _load_orjson():
+    """Return the orjson module, or None when it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        # orjson is optional (``perf`` extra); fall back to the stdlib codec
+        return None
+    return orjson
+
+
+# Files below this size are read directly; larger ones are mmapped and
+# hashed in HASH_CHUNK_SIZE slices
+MMAP_THRESHOLD = 64 * 1024
+HASH_CHUNK_SIZE = 1 << 20
+
+# Hashing releases the GIL, so doc files are stat'ed/hashed concurrently
+HASH_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# Parsed glossaries are cached per user, outside the checkout, so files in the
+# repository (e.g. from a pull request) never feed the cache
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "heinrich"
+
+# Glossaries are parsed in worker processes only when this many bytes need
+# parsing; below it process start-up costs more than the parse itself
+PARALLEL_PARSE_THRESHOLD = 1 << 20
+
+
+def _parse_yaml(content: bytes) -> dict:
+    """Parse YAML content (top-level so worker processes can run it)."""
+    import yaml
+    
+    # libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+def _content_hash(content: bytes) -> str:
+    """BLAKE2b-256 hex digest of file content, as _compute_file_hash returns."""
+    import hashlib
+    
+    return hashlib.blake2b(content, digest_size=32).hexdigest()
+
+
+def _walk_md(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield Markdown files under root, skipping hidden directories.
+    
+    Uses os.scandir directly so file type checks come from the directory
+    listing and each entry's stat() result is cached on the entry.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield entry
 
 
 class TranslationSync:
@@ -39,26 +101,196 @@ class TranslationSync:
         self.docs_dir = self.repo_root / "docs"
         self.sync_state_file = self.i18n_dir / ".sync_state.json"
         self.sync_state = self._load_sync_state()
+        import hashlib
+        repo_key = hashlib.blake2b(str(self.repo_root.resolve()).encode(), digest_size=8).hexdigest()
+        self.glossary_cache_file = CACHE_DIR / f"glossary_cache-{repo_key}.json"
+        self._glossary_cache: Dict[str, Tuple[str, dict]] = self._load_glossary_cache()
+        self._glossary_cache_dirty = False
+        # Glossaries whose cache entry _prefetch_glossaries just checked
+        self._glossary_prefetched: Set[str] = set()
         
     def _load_sync_state(self) -> Dict:
         """Load synchronization state from file."""
         if self.sync_state_file.exists():
-            with open(self.sync_state_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {"file_hashes": {}, "last_sync": None}
+            orjson = _load_orjson()
+            if orjson is not None:
+                state = orjson.loads(self.sync_state_file.read_bytes())
+            else:
+                import json
+                with open(self.sync_state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            state.setdefault("file_stats", {})
+            return state
+        return {"file_hashes": {}, "file_stats": {}, "last_sync": None}
     
     def _save_sync_state(self):
         """Save synchronization state to file."""
         self.sync_state["last_sync"] = datetime.now().isoformat()
+        orjson = _load_orjson()
+        if orjson is not None:
+            self.sync_state_file.write_bytes(orjson.dumps(self.sync_state, option=orjson.OPT_INDENT_2))
+            return
+        import json
         with open(self.sync_state_file, 'w', encoding='utf-8') as f:
             json.dump(self.sync_state, f, indent=2, ensure_ascii=False)
     
+    def _load_glossary_cache(self) -> Dict[str, Tuple[str, dict]]:
+        """Load parsed glossaries persisted by a previous run."""
+        try:
+            raw = self.glossary_cache_file.read_bytes()
+            orjson = _load_orjson()
+            if orjson is not None:
+                cache = orjson.loads(raw)
+            else:
+                import json
+                cache = json.loads(raw)
+        except Exception:
+            # Missing, unreadable or corrupt cache: everything is reparsed
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _save_glossary_cache(self):
+        """Persist parsed glossaries if any were (re)parsed this run."""
+        if not self._glossary_cache_dirty:
+            return
+        self.glossary_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        orjson = _load_orjson()
+        if orjson is not None:
+            self.glossary_cache_file.write_bytes(orjson.dumps(self._glossary_cache))
+        else:
+            import json
+            self.glossary_cache_file.write_text(
+                json.dumps(self._glossary_cache, ensure_ascii=False), encoding='utf-8'
+            )
+        self._glossary_cache_dirty = False
+    
+    def _load_yaml_cached(self, file_path: Path) -> dict:
+        """
+        Load a YAML file, reparsing only when its content hash changed.
+        
+        Args:
+            file_path: YAML file to load
+            
+        Returns:
+            Parsed YAML content
+        """
+        key = str(file_path)
+        if key in self._glossary_prefetched:
+            self._glossary_prefetched.discard(key)
+            return self._glossary_cache[key][1]
+        
+        content = file_path.read_bytes()
+        content_hash = _content_hash(content)
+        cached = self._glossary_cache.get(key)
+        if cached is not None and cached[0] == content_hash:
+            return cached[1]
+        
+        data = _parse_yaml(content)
+        self._glossary_cache[key] = (content_hash, data)
+        self._glossary_cache_dirty = True
+        return data
+    
+    def _prefetch_glossaries(self, paths: List[Path]):
+        """
+        Bring the glossary cache up to date for files about to be loaded,
+        reading and hashing each once and parsing stale ones in parallel
+        processes when they are large enough to be worth it.
+        
+        Args:
+            paths: Existing glossary files about to be loaded
+        """
+        pending = []
+        for path in paths:
+            content = path.read_bytes()
+            content_hash = _content_hash(content)
+            cached = self._glossary_cache.get(str(path))
+            if cached is None or cached[0] != content_hash:
+                pending.append((path, content_hash, content))
+        
+        contents = [content for _, _, content in pending]
+        if len(pending) < 2 or sum(map(len, contents)) < PARALLEL_PARSE_THRESHOLD:
+            parsed = list(map(_parse_yaml, contents))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=len(pending)) as executor:
+                parsed = list(executor.map(_parse_yaml, contents))
+        for (path, content_hash, _), data in zip(pending, parsed):
+            self._glossary_cache[str(path)] = (content_hash, data)
+        if pending:
+            self._glossary_cache_dirty = True
+        self._glossary_prefetched.update(str(path) for path in paths)
+    
     def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA256 hash of file content."""
-        if not file_path.exists():
+        """Compute BLAKE2b-256 hash of file content."""
+        try:
+            size = file_path.stat().st_size
+        except FileNotFoundError:
             return ""
-        with open(file_path, 'rb') as f:
-            return hashlib.sha256(f.read()).hexdigest()
+        
+        import hashlib
+        import mmap
+        
+        h = hashlib.blake2b(digest_size=32)
+        if size < MMAP_THRESHOLD:
+            with open(file_path, 'rb') as f:
+                h.update(f.read())
+            return h.hexdigest()
+        
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for start in range(0, len(view), HASH_CHUNK_SIZE):
+                        h.update(view[start:start + HASH_CHUNK_SIZE])
+                finally:
+                    view.release()
+        finally:
+            os.close(fd)
+        return h.hexdigest()
+    
+    def _current_file_hash(self, file_path: Union[Path, os.DirEntry]) -> Tuple[str, List[int]]:
+        """
+        Return the content hash of a tracked file, rehashing only when its
+        mtime or size differs from the recorded stat.
+        
+        Does not modify sync state, so it is safe to call from worker threads.
+        
+        Args:
+            file_path: Tracked file, as a Path or a scandir entry
+            
+        Returns:
+            Tuple of (content hash, [mtime_ns, size])
+        """
+        key = os.fspath(file_path)
+        st = file_path.stat()
+        stat_key = [st.st_mtime_ns, st.st_size]
+        stored_hash = self.sync_state["file_hashes"].get(key, "")
+        if stored_hash and self.sync_state["file_stats"].get(key) == stat_key:
+            return stored_hash, stat_key
+        return self._compute_file_hash(file_path), stat_key
+    
+    def _record_file(self, key: str, current_hash: str, stat_key: List[int],
+                     changes: Dict[str, List[Path]]):
+        """
+        Classify a tracked file against the stored hash and update state.
+        
+        Args:
+            key: The file's path string, as used in sync state
+            current_hash: Content hash from _current_file_hash
+            stat_key: [mtime_ns, size] from _current_file_hash
+            changes: detect_changes() result to append to
+        """
+        stored_hash = self.sync_state["file_hashes"].get(key, "")
+        
+        if not stored_hash:
+            changes["new"].append(Path(key))
+        elif current_hash != stored_hash:
+            changes["modified"].append(Path(key))
+        
+        # Update hash
+        self.sync_state["file_hashes"][key] = current_hash
+        self.sync_state["file_stats"][key] = stat_key
     
     def detect_changes(self) -> Dict[str, List[Path]]:
         """
@@ -76,31 +308,19 @@ class TranslationSync:
         # Check glossary changes
         en_glossary = self.i18n_dir / "glossary_en.yaml"
         if en_glossary.exists():
-            current_hash = self._compute_file_hash(en_glossary)
-            stored_hash = self.sync_state["file_hashes"].get(str(en_glossary), "")
-            
-            if not stored_hash:
-                changes["new"].append(en_glossary)
-            elif current_hash != stored_hash:
-                changes["modified"].append(en_glossary)
-            
-            # Update hash
-            self.sync_state["file_hashes"][str(en_glossary)] = current_hash
+            self._record_file(str(en_glossary), *self._current_file_hash(en_glossary), changes)
         
         # Check documentation changes
         en_docs_dir = self.docs_dir / "en"
         if en_docs_dir.exists():
-            for doc_file in en_docs_dir.rglob("*.md"):
-                current_hash = self._compute_file_hash(doc_file)
-                stored_hash = self.sync_state["file_hashes"].get(str(doc_file), "")
-                
-                if not stored_hash:
-                    changes["new"].append(doc_file)
-                elif current_hash != stored_hash:
-                    changes["modified"].append(doc_file)
-                
-                # Update hash
-                self.sync_state["file_hashes"][str(doc_file)] = current_hash
+            doc_entries = list(_walk_md(en_docs_dir))
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+                results = list(executor.map(self._current_file_hash, doc_entries))
+            
+            # State is only mutated here, after all workers have finished
+            for entry, (current_hash, stat_key) in zip(doc_entries, results):
+                self._record_file(entry.path, current_hash, stat_key, changes)
         
         return changes
     
@@ -119,11 +339,14 @@ class TranslationSync:
             issues["en"] = ["Canonical English glossary not found"]
             return issues
         
-        with open(en_glossary_path, 'r', encoding='utf-8') as f:
-            en_glossary = yaml.safe_load(f)
+        self._prefetch_glossaries([
+            path for path in (self.i18n_dir / f"glossary_{lang}.yaml" for lang in self.SUPPORTED_LANGUAGES)
+            if path.exists()
+        ])
+        en_glossary = self._load_yaml_cached(en_glossary_path)
         
         # Get all term keys from English glossary (excluding metadata)
-        en_terms = {k for k in en_glossary.keys() if k != "metadata"}
+        en_terms = en_glossary.keys() - {"metadata"}
         
         # Validate each target language
         for lang in self.SUPPORTED_LANGUAGES:
@@ -138,26 +361,28 @@ class TranslationSync:
                 issues[lang] = lang_issues
                 continue
             
-            with open(glossary_path, 'r', encoding='utf-8') as f:
-                lang_glossary = yaml.safe_load(f)
-            
-            lang_terms = {k for k in lang_glossary.keys() if k != "metadata"}
+            lang_glossary = self._load_yaml_cached(glossary_path)
             
-            # Check for missing terms
-            missing_terms = en_terms - lang_terms
-            if missing_terms:
-                lang_issues.append(f"Missing {len(missing_terms)} terms: {', '.join(list(missing_terms)[:5])}...")
+            lang_terms = lang_glossary.keys() - {"metadata"}
             
-            # Check for extra terms
-            extra_terms = lang_terms - en_terms
-            if extra_terms:
-                lang_issues.append(f"Extra {len(extra_terms)} terms not in English: {', '.join(list(extra_terms)[:5])}...")
+            # Complete glossaries (the common case) need no set differences
+            if lang_terms == en_terms:
+                common_terms = en_terms
+            else:
+                # Check for missing terms
+                missing_terms = en_terms - lang_terms
+                if missing_terms:
+                    lang_issues.append(f"Missing {len(missing_terms)} terms: {', '.join(list(missing_terms)[:5])}...")
+                
+                # Check for extra terms
+                extra_terms = lang_terms - en_terms
+                if extra_terms:
+                    lang_issues.append(f"Extra {len(extra_terms)} terms not in English: {', '.join(list(extra_terms)[:5])}...")
+                
+                common_terms = en_terms & lang_terms
             
             # Validate each term has translation
-            for term in en_terms:
-                if term not in lang_glossary:
-                    continue
-                    
+            for term in common_terms:
                 term_data = lang_glossary[term]
                 if not isinstance(term_data, dict):
                     continue
@@ -168,6 +393,7 @@ class TranslationSync:
             if lang_issues:
                 issues[lang] = lang_issues
         
+        self._save_glossary_cache()
         return issues
     
     def generate_translation_report(self, output_file: Path = None) -> str:
@@ -187,9 +413,12 @@ class TranslationSync:
             "# Translation Synchronization Report",
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             "",
+            "",  # Total tasks, filled in once tasks are counted
+            "",
             "## Changes Detected in English Content",
             ""
         ]
+        total_slot = 3
         
         if changes["new"]:
             report_lines.append(f"### New Files ({len(changes['new'])})")
@@ -227,6 +456,18 @@ class TranslationSync:
             ""
         ])
         
+        # Classify changed files once; None marks the glossary, otherwise the
+        # doc path relative to docs/en (mapped per language below)
+        en_docs = self.docs_dir / "en"
+        en_docs_parts = en_docs.parts
+        docs_rel = str(self.docs_dir.relative_to(self.repo_root))
+        changed_files = []
+        for f in changes["new"] + changes["modified"]:
+            if "glossary" in f.name:
+                changed_files.append(None)
+            elif f.parts[:len(en_docs_parts)] == en_docs_parts:
+                changed_files.append(str(f.relative_to(en_docs)))
+        
         # Generate tasks based on changes
         total_tasks = 0
         for lang in self.SUPPORTED_LANGUAGES:
@@ -236,13 +477,12 @@ class TranslationSync:
             tasks = []
             
             # Tasks from file changes
-            for f in changes["new"] + changes["modified"]:
-                rel_path = f.relative_to(self.repo_root)
-                if "glossary" in str(f):
+            for doc_path in changed_files:
+                if doc_path is None:
                     tasks.append(f"Update glossary: `i18n/glossary_{lang}.yaml`")
-                elif str(f).startswith(str(self.docs_dir / "en")):
+                else:
                     # Map to target language docs
-                    target_path = str(rel_path).replace("/en/", f"/{lang}/")
+                    target_path = os.path.join(docs_rel, lang, doc_path)
                     tasks.append(f"Translate/Update: `{target_path}`")
             
             # Tasks from glossary issues
@@ -258,41 +498,44 @@ class TranslationSync:
         
         if total_tasks == 0:
             report_lines.append("✅ No translation tasks required")
-        else:
-            report_lines.insert(6, f"**Total tasks**: {total_tasks}")
+        report_lines[total_slot] = f"**Total tasks**: {total_tasks}"
         
         report = "\n".join(report_lines)
         
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+            output_file.write_text(report, encoding='utf-8')
         
         return report
     
-    def mark_outdated(self) -> int:
+    def mark_outdated(self, changes: Dict[str, List[Path]] = None) -> int:
         """
         Mark outdated translations.
         
+        Args:
+            changes: Result of an earlier detect_changes() call to reuse;
+                detected afresh when omitted
+        
         Returns:
             Number of files marked as outdated
         """
-        changes = self.detect_changes()
+        if changes is None:
+            changes = self.detect_changes()
         marked = 0
         
         for changed_file in changes["modified"]:
             # For each changed English file, mark corresponding translations
-            rel_path = changed_file.relative_to(self.repo_root)
+            rel_path_str = str(changed_file.relative_to(self.repo_root))
             
             for lang in self.SUPPORTED_LANGUAGES:
                 if lang == self.CANONICAL_LANGUAGE:
                     continue
                 
                 # Map to target language file
-                target_path = self.repo_root / str(rel_path).replace("/en/", f"/{lang}/")
+                target_rel = rel_path_str.replace("/en/", f"/{lang}/")
                 
-                if target_path.exists():
+                if (self.repo_root / target_rel).exists():
                     # Add outdated marker comment/metadata
-                    print(f"⚠️  Marked as outdated: {target_path.relative_to(self.repo_root)}")
+                    print(f"⚠️  Marked as outdated: {target_rel}")
                     marked += 1
         
         return marked
@@ -306,7 +549,7 @@ class TranslationSync:
         
         if total_changes > 0:
             print(f"📝 Detected {total_changes} changes in English content")
-            marked = self.mark_outdated()
+            marked = self.mark_outdated(changes)
             print(f"⚠️  Marked {marked} translation files as outdated")
         else:
             print("✅ No changes detected in English content")
@@ -326,6 +569,56 @@ class TranslationSync:
         print(f"\n💾 Saved synchronization state")
         
         print("\n✅ Synchronization complete!")
+    
+    def _sidecar_source(self, sidecar: Path) -> Optional[Dict]:
+        """Return the YAML stamp recorded in a sidecar, or None if unreadable."""
+        orjson = _load_orjson()
+        try:
+            if orjson is not None:
+                entry = orjson.loads(sidecar.read_bytes())
+            else:
+                import json
+                entry = json.loads(sidecar.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return entry.get("source") if isinstance(entry, dict) else None
+    
+    def build_glossary_json(self) -> List[Path]:
+        """
+        Write a ``glossary_<lang>.json`` sidecar next to each YAML glossary.
+        
+        The YAML stays the source of truth; the sidecars only exist so that
+        consumers such as the multilingual tests can skip YAML parsing. Each
+        sidecar is ``{"source": {"size", "mtime_ns"}, "data": glossary}``,
+        where ``source`` describes the YAML it was built from; consumers
+        ignore a sidecar whose ``source`` no longer matches the YAML.
+        
+        Returns:
+            Paths of the sidecars that were (re)written
+        """
+        written = []
+        orjson = _load_orjson()
+        for lang in self.SUPPORTED_LANGUAGES:
+            glossary_path = self.i18n_dir / f"glossary_{lang}.yaml"
+            if not glossary_path.exists():
+                continue
+            
+            stat = glossary_path.stat()
+            source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            sidecar = glossary_path.with_suffix(".json")
+            if self._sidecar_source(sidecar) == source:
+                continue
+            
+            entry = {"source": source, "data": self._load_yaml_cached(glossary_path)}
+            if orjson is not None:
+                sidecar.write_bytes(orjson.dumps(entry))
+            else:
+                import json
+                sidecar.write_text(json.dumps(entry, ensure_ascii=False), encoding='utf-8')
+            written.append(sidecar)
+        
+        self._save_glossary_cache()
+        return written
 
 
 def main():
@@ -335,7 +628,7 @@ def main():
     )
     parser.add_argument(
         "command",
-        choices=["detect", "validate", "report", "sync"],
+        choices=["detect", "validate", "report", "sync", "build-json"],
         help="Command to execute"
     )
     parser.add_argument(
@@ -385,6 +678,12 @@ def main():
     
     elif args.command == "sync":
         sync.sync()
+    
+    elif args.command == "build-json":
+        written = sync.build_glossary_json()
+        print(f"Wrote {len(written)} glossary JSON sidecar(s)")
+        for path in written:
+            print(f"  - {path.relative_to(args.repo_root)}")
 
 
 if __name__ == "__main__":
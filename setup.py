@@ -2,8 +2,23 @@
 Setup configuration for Heinrich TRIZ Engine
 """
 
+import re
+from pathlib import Path
+
 from setuptools import setup, find_packages
-from heinrich.version import __version__, __author__, __description__
+
+# Parse version metadata textually so building does not import the package
+# (and with it numpy, PyYAML, ...)
+_version_source = (Path(__file__).parent / "heinrich" / "version.py").read_text(encoding="utf-8")
+
+
+def _read_meta(name):
+    return re.search(r'^%s\s*=\s*"([^"]+)"' % name, _version_source, re.M).group(1)
+
+
+__version__ = _read_meta("__version__")
+__author__ = _read_meta("__author__")
+__description__ = _read_meta("__description__")
 
 # Read the contents of README file
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -51,9 +66,13 @@ setup(
             "fastapi>=0.100.0",
             "uvicorn>=0.20.0",
         ],
+        "perf": [
+            "orjson>=3.9.0",
+        ],
         "ui": [
             "rich>=12.0.0",
             "colorama>=0.4.0",
+            "prompt_toolkit>=3.0.0",
         ],
     },
     entry_points={
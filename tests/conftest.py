@@ -1,6 +1,7 @@
 """
 pytest configuration file for Heinrich TRIZ Engine tests.
 """
+import os
 import sys
 import pytest
 from pathlib import Path
@@ -9,7 +10,31 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-@pytest.fixture
+
+def pytest_addoption(parser):
+    """Register Heinrich-specific command line options."""
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Persist expensive fixture results (parsed glossaries) in .pytest_cache across runs",
+    )
+
+
+def pytest_configure(config):
+    """Drop cache writes and unused plugins when HEINRICH_FAST_TESTS=1."""
+    if os.environ.get("HEINRICH_FAST_TESTS") != "1":
+        return
+    # The --lf/--nf bookkeeping plugins are what write .pytest_cache on every
+    # run; the cacheprovider registers them before this hook runs. The doctest
+    # plugin is consulted for every collected file but the suite has none.
+    for name in ("lfplugin", "nfplugin", "doctest"):
+        plugin = config.pluginmanager.get_plugin(name)
+        if plugin is not None:
+            config.pluginmanager.unregister(plugin)
+
+
+@pytest.fixture(scope="session")
 def sample_problem_text():
     """Sample problem text for testing."""
     return "We need to make a car faster, but increasing engine power makes it consume more fuel."
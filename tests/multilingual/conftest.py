@@ -1,17 +1,26 @@
 """
 Pytest configuration for multilingual tests.
 """
+import os
 import pytest
 from pathlib import Path
 
 
-@pytest.fixture
+def _load_yaml(data):
+    """Parse YAML, importing yaml only once a glossary fixture is requested."""
+    import yaml
+
+    # libyaml C loader when available; same output as safe_load
+    return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+@pytest.fixture(scope="session")
 def repo_root():
     """Return the repository root directory."""
     return Path(__file__).parent.parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def i18n_dir(repo_root):
     """Return the i18n directory."""
     return repo_root / "i18n"
@@ -23,7 +32,25 @@ def docs_dir(repo_root):
     return repo_root / "docs"
 
 
-@pytest.fixture
+def _scan(directory):
+    """Return dict of entry name to ``os.DirEntry`` for one directory listing."""
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it}
+
+
+@pytest.fixture(scope="session")
+def i18n_index(i18n_dir):
+    """Return the i18n directory listing, scanned once per session."""
+    return _scan(i18n_dir)
+
+
+@pytest.fixture(scope="session")
+def docs_index(repo_root):
+    """Return the docs directory listing, scanned once per session."""
+    return _scan(repo_root / "docs")
+
+
+@pytest.fixture(scope="session")
 def glossary_files(i18n_dir):
     """Return dict of language to glossary file path."""
     return {
@@ -34,6 +61,108 @@ def glossary_files(i18n_dir):
     }
 
 
+def _load_glossary_source(filepath):
+    """Parse a glossary, preferring a JSON sidecar built from the current YAML.
+
+    Sidecars are written by ``python i18n/sync_translations.py build-json``
+    and record the size and mtime of the YAML they were built from; a sidecar
+    whose record no longer matches the YAML is ignored.
+    """
+    import json
+
+    try:
+        entry = json.loads(filepath.with_suffix(".json").read_bytes())
+    except (OSError, ValueError):
+        entry = None
+    if isinstance(entry, dict):
+        stat = filepath.stat()
+        if entry.get("source") == {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}:
+            return entry["data"]
+    return _load_yaml(filepath.read_bytes())
+
+
+def _load_glossary_cached(cache, lang, filepath):
+    """Parse a glossary, reusing the copy in pytest's cache while the file is unchanged.
+
+    Args:
+        cache: ``pytestconfig.cache``, or None when --cached is not given or the
+            cacheprovider plugin is disabled
+        lang: Language code, used as the cache key
+        filepath: Path to the glossary file
+
+    Returns:
+        The parsed glossary
+    """
+    if cache is None:
+        return _load_glossary_source(filepath)
+
+    key = f"heinrich/glossary/{lang}"
+    stat = filepath.stat()
+    stamp = [str(filepath), stat.st_mtime_ns, stat.st_size]
+    entry = cache.get(key, None)
+    if entry and entry.get("stamp") == stamp:
+        return entry["data"]
+
+    data = _load_glossary_source(filepath)
+    cache.set(key, {"stamp": stamp, "data": data})
+    return data
+
+
+@pytest.fixture(scope="session")
+def glossaries(glossary_files, pytestconfig):
+    """Return dict of language to parsed glossary, loaded once per session."""
+    # Cross-run reuse is opt-in via --cached
+    cache = getattr(pytestconfig, "cache", None) if pytestconfig.getoption("cached") else None
+    return {lang: _load_glossary_cached(cache, lang, filepath)
+            for lang, filepath in glossary_files.items()}
+
+
+def _load_metadata(filepath):
+    """Parse only the leading ``metadata:`` block of a glossary.
+
+    Falls back to a full parse when the block is not at the top of the file.
+    """
+    head = []
+    with open(filepath, 'rb') as f:
+        for line in f:
+            if head and line[:1] not in (b" ", b"\t", b"\r", b"\n", b"#"):
+                break
+            if head or line.startswith(b"metadata:"):
+                head.append(line)
+            elif line.strip() and not line.startswith(b"#"):
+                break
+    data = _load_yaml(b"".join(head)) if head else None
+    if not isinstance(data, dict) or "metadata" not in data:
+        data = _load_yaml(filepath.read_bytes()) or {}
+    return data.get("metadata")
+
+
+@pytest.fixture(scope="session")
+def glossary_metadata(glossary_files):
+    """Return dict of language to glossary metadata, without parsing the terms."""
+    return {lang: _load_metadata(filepath) for lang, filepath in glossary_files.items()}
+
+
+@pytest.fixture(scope="session")
+def glossary_term_sets(glossaries):
+    """Return dict of language to the glossary's term keys (metadata excluded)."""
+    return {lang: frozenset(data) - {"metadata"} for lang, data in glossaries.items()}
+
+
+@pytest.fixture(scope="session")
+def glossary_principles(glossaries):
+    """Return dict of language to its ``principle_*`` term keys, in file order."""
+    return {lang: [k for k in data if k.startswith("principle_")]
+            for lang, data in glossaries.items()}
+
+
+@pytest.fixture(scope="session")
+def glossary_parameters(glossaries):
+    """Return dict of language to its ``parameter_*`` term keys, in file order."""
+    return {lang: [k for k in data if k.startswith("parameter_")]
+            for lang, data in glossaries.items()}
+
+
 @pytest.fixture
 def docs_dirs(docs_dir):
     """Return dict of language to docs directory path."""
@@ -0,0 +1,199 @@
+"""
+Tests for Chinese, Russian and Arabic language support.
+"""
+import os
+import re
+from functools import lru_cache
+
+import pytest
+from pathlib import Path
+
+
+LANGUAGES = ["zh", "ru", "ar"]
+
+LANGUAGE_NAMES = {
+    "zh": "Chinese",
+    "ru": "Russian",
+    "ar": "Arabic",
+}
+
+# Unicode block each language's text is expected to use
+SCRIPT_PATTERNS = {
+    "zh": re.compile(r"[\u4e00-\u9fff]"),
+    "ru": re.compile(r"[\u0400-\u04FF]"),
+    "ar": re.compile(r"[\u0600-\u06FF]"),
+}
+
+
+CORE_TERMS = frozenset({
+    "triz",
+    "contradiction",
+    "technical_contradiction",
+    "physical_contradiction",
+    "inventive_principles",
+    "engineering_parameters",
+})
+
+
+@lru_cache(maxsize=None)
+def _read_md(path_str, mtime_ns):
+    """Read a markdown file once per session; keying on mtime re-reads edited files."""
+    return Path(path_str).read_text(encoding='utf-8')
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_glossary_exists(glossary_files, i18n_index, lang):
+    """Test that the language glossary file exists."""
+    assert glossary_files[lang].name in i18n_index, f"{LANGUAGE_NAMES[lang]} glossary file not found"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_glossary_valid_yaml(glossaries, lang):
+    """Test that the language glossary is valid YAML."""
+    data = glossaries[lang]
+    assert data is not None, f"{LANGUAGE_NAMES[lang]} glossary is empty"
+    assert isinstance(data, dict), f"{LANGUAGE_NAMES[lang]} glossary is not a dictionary"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_glossary_has_metadata(glossary_metadata, lang):
+    """Test that the language glossary has required metadata."""
+    metadata = glossary_metadata[lang]
+
+    assert metadata is not None, f"{LANGUAGE_NAMES[lang]} glossary missing metadata"
+
+    assert metadata["language"] == lang, f"Language not set to {lang}"
+    assert "version" in metadata, "Missing version"
+    assert "last_updated" in metadata, "Missing last_updated"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_glossary_has_core_terms(glossaries, lang):
+    """Test that the language glossary has core TRIZ terms."""
+    missing = CORE_TERMS - glossaries[lang].keys()
+    assert not missing, f"Missing core terms: {', '.join(sorted(missing))}"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_translations_present(glossaries, lang):
+    """Test that translations are present for terms."""
+    data = glossaries[lang]
+    name = LANGUAGE_NAMES[lang]
+
+    # Check a few key terms have translations
+    assert lang in data["triz"], f"TRIZ term missing {name} translation"
+    assert lang in data["contradiction"], f"Contradiction missing {name} translation"
+
+    # Verify translated text is actually present (not just en)
+    assert data["contradiction"][lang] != data["contradiction"]["en"], \
+        f"{name} translation is same as English"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_docs_directory_exists(docs_index, lang):
+    """Test that the language documentation directory exists."""
+    assert lang in docs_index, f"{LANGUAGE_NAMES[lang]} docs directory not found"
+    assert docs_index[lang].is_dir(), f"{LANGUAGE_NAMES[lang]} docs path is not a directory"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_docs_have_readme(docs_dirs, lang):
+    """Test that the language docs have README."""
+    readme = docs_dirs[lang] / "README.md"
+    assert readme.is_file(), f"{LANGUAGE_NAMES[lang]} README.md not found"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_docs_utf8_encoding(docs_dirs, lang):
+    """Test that documentation files are UTF-8 encoded and use the language's script."""
+    script = SCRIPT_PATTERNS[lang]
+    with os.scandir(docs_dirs[lang]) as it:
+        for entry in it:
+            if not (entry.name.endswith(".md") and entry.is_file()):
+                continue
+            # Decoding is the UTF-8 check, so the text path is kept on purpose
+            content = _read_md(entry.path, entry.stat().st_mtime_ns)
+            assert content, f"File {entry.name} is empty"
+            assert script.search(content), f"File {entry.name} has no {LANGUAGE_NAMES[lang]} characters"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_glossary_consistency(glossary_term_sets, lang):
+    """Test that the language glossary is consistent with English."""
+    # Check for missing terms
+    missing_terms = glossary_term_sets["en"] - glossary_term_sets[lang]
+    assert len(missing_terms) == 0, \
+        f"{LANGUAGE_NAMES[lang]} glossary missing terms: {', '.join(list(missing_terms)[:5])}"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_principle_translations(glossaries, glossary_principles, lang):
+    """Test that the language has principle translations."""
+    data = glossaries[lang]
+
+    # Check at least a few principles have translations
+    principles = glossary_principles[lang]
+    assert len(principles) >= 10, "Not enough principle translations"
+
+    for principle_key in principles[:5]:  # Check first 5
+        principle = data[principle_key]
+        assert lang in principle, f"{principle_key} missing {LANGUAGE_NAMES[lang]} translation"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_parameter_translations(glossaries, glossary_parameters, lang):
+    """Test that the language has parameter translations."""
+    data = glossaries[lang]
+
+    # Check at least a few parameters have translations
+    parameters = glossary_parameters[lang]
+    assert len(parameters) >= 10, "Not enough parameter translations"
+
+    for param_key in parameters[:5]:  # Check first 5
+        param = data[param_key]
+        assert lang in param, f"{param_key} missing {LANGUAGE_NAMES[lang]} translation"
+
+
+def test_russian_triz_translation(glossaries):
+    """Test that TRIZ is translated as ТРИЗ in Russian."""
+    assert glossaries["ru"]["triz"]["ru"] == "ТРИЗ", "TRIZ translation should be ТРИЗ"
+
+
+def test_russian_ariz_terminology(glossaries):
+    """Test that Russian has ARIZ terminology (original language)."""
+    data = glossaries["ru"]
+
+    # ARIZ should be in Russian glossary
+    assert "ariz" in data, "Missing ARIZ term"
+    assert "ru" in data["ariz"], "ARIZ missing Russian translation"
+
+    # IFR (Ideal Final Result) should be ИКР in Russian
+    assert "ideal_final_result" in data, "Missing Ideal Final Result term"
+    if "ru" in data["ideal_final_result"]:
+        # Check if abbreviation field exists and contains ИКР
+        if "abbreviation" in data["ideal_final_result"]:
+            assert "ИКР" in data["ideal_final_result"]["abbreviation"], \
+                "IFR abbreviation should be ИКР in Russian"
+
+
+def test_arabic_rtl_support(glossary_metadata):
+    """Test that Arabic glossary is marked for RTL support."""
+    metadata = glossary_metadata["ar"]
+
+    # Check metadata has RTL flag
+    assert metadata is not None, "Missing metadata"
+    assert metadata.get("rtl") == True, \
+        "Arabic glossary should have rtl: true in metadata"
+
+
+def test_arabic_text_direction(glossaries):
+    """Test that Arabic translations use proper text."""
+    data = glossaries["ar"]
+
+    # Check that Arabic translations contain Arabic script
+    for key in ["triz", "contradiction", "inventive_principles"]:
+        if key in data and "ar" in data[key]:
+            ar_text = data[key]["ar"]
+            # Verify it's not empty and contains Arabic characters
+            assert ar_text, f"{key} has empty Arabic translation"
+            assert SCRIPT_PATTERNS["ar"].search(ar_text), f"{key} Arabic translation has no Arabic script"
@@ -2,41 +2,32 @@
 Tests for terminology consistency across all languages.
 """
 import pytest
-import yaml
 from pathlib import Path
 
 
-def test_all_glossaries_have_same_terms(glossary_files):
+def test_all_glossaries_have_same_terms(glossary_term_sets):
     """Test that all glossaries have the same set of terms."""
-    # Load all glossaries
-    glossaries = {}
-    for lang, filepath in glossary_files.items():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            glossaries[lang] = yaml.safe_load(f)
-    
-    # Get term sets (excluding metadata)
-    term_sets = {}
-    for lang, data in glossaries.items():
-        term_sets[lang] = {k for k in data.keys() if k != "metadata"}
-    
     # English is canonical
-    en_terms = term_sets["en"]
+    en_terms = glossary_term_sets["en"]
     
-    # Check each language has all English terms
+    # Collect every language's differences from English, then assert once
+    problems = []
     for lang in ["zh", "ru", "ar"]:
-        missing = en_terms - term_sets[lang]
-        extra = term_sets[lang] - en_terms
-        
-        assert len(missing) == 0, \
-            f"{lang.upper()} glossary missing {len(missing)} terms: {', '.join(list(missing)[:10])}"
-        
-        assert len(extra) == 0, \
-            f"{lang.upper()} glossary has {len(extra)} extra terms not in English: {', '.join(list(extra)[:10])}"
+        missing = en_terms - glossary_term_sets[lang]
+        extra = glossary_term_sets[lang] - en_terms
+        if missing:
+            problems.append(f"{lang.upper()} glossary missing {len(missing)} terms: "
+                            f"{', '.join(sorted(missing)[:10])}")
+        if extra:
+            problems.append(f"{lang.upper()} glossary has {len(extra)} extra terms not in English: "
+                            f"{', '.join(sorted(extra)[:10])}")
+    
+    assert not problems, "\n".join(problems)
 
 
-def test_core_triz_terms_consistency(glossary_files):
+def test_core_triz_terms_consistency(glossaries):
     """Test that core TRIZ terms are consistently defined across languages."""
-    core_terms = [
+    core_terms = frozenset({
         "triz",
         "contradiction",
         "technical_contradiction",
@@ -45,87 +36,59 @@ def test_core_triz_terms_consistency(glossary_files):
         "engineering_parameters",
         "ariz",
         "ideal_final_result",
-    ]
-    
-    # Load all glossaries
-    glossaries = {}
-    for lang, filepath in glossary_files.items():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            glossaries[lang] = yaml.safe_load(f)
+    })
     
     # Check each core term exists in all languages
-    for term in core_terms:
-        for lang, data in glossaries.items():
-            assert term in data, f"Term '{term}' missing from {lang.upper()} glossary"
+    missing = {lang: sorted(core_terms - data.keys()) for lang, data in glossaries.items()}
+    missing = {lang: terms for lang, terms in missing.items() if terms}
+    assert not missing, f"Core terms missing by language: {missing}"
 
 
-def test_principle_numbering_consistency(glossary_files):
+def _assert_numbering_consistent(glossaries, en_keys):
+    """Assert each of the English ``en_keys`` terms keeps its number in every language."""
+    en_data = glossaries["en"]
+    keys = [k for k in en_keys if isinstance(en_data[k], dict)]
+    en_numbers = tuple(en_data[k].get("number") for k in keys)
+
+    if None in en_numbers:
+        key = keys[en_numbers.index(None)]
+        pytest.fail(f"{key} missing number in English")
+
+    for lang in ["zh", "ru", "ar"]:
+        data = glossaries[lang]
+        # Terms absent from a translation keep the English number, so only
+        # numbering differences can make the tuples unequal
+        lang_numbers = tuple(data[k].get("number") if k in data else n
+                             for k, n in zip(keys, en_numbers))
+        if lang_numbers == en_numbers:
+            continue
+
+        for key, lang_number, en_number in zip(keys, lang_numbers, en_numbers):
+            assert lang_number == en_number, \
+                f"{key} has different number in {lang.upper()}: {lang_number} vs {en_number}"
+
+
+def test_principle_numbering_consistency(glossaries, glossary_principles):
     """Test that principle numbering is consistent across languages."""
-    # Load all glossaries
-    glossaries = {}
-    for lang, filepath in glossary_files.items():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            glossaries[lang] = yaml.safe_load(f)
-    
-    # Get principle terms from English
-    en_principles = {k: v for k, v in glossaries["en"].items() 
-                     if k.startswith("principle_") and isinstance(v, dict)}
-    
-    # Check each principle has consistent number across languages
-    for principle_key, en_data in en_principles.items():
-        en_number = en_data.get("number")
-        assert en_number is not None, f"{principle_key} missing number in English"
-        
-        for lang in ["zh", "ru", "ar"]:
-            if principle_key in glossaries[lang]:
-                lang_data = glossaries[lang][principle_key]
-                lang_number = lang_data.get("number")
-                
-                assert lang_number == en_number, \
-                    f"{principle_key} has different number in {lang.upper()}: {lang_number} vs {en_number}"
+    _assert_numbering_consistent(glossaries, glossary_principles["en"])
 
 
-def test_parameter_numbering_consistency(glossary_files):
+def test_parameter_numbering_consistency(glossaries, glossary_parameters):
     """Test that parameter numbering is consistent across languages."""
-    # Load all glossaries
-    glossaries = {}
-    for lang, filepath in glossary_files.items():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            glossaries[lang] = yaml.safe_load(f)
-    
-    # Get parameter terms from English
-    en_parameters = {k: v for k, v in glossaries["en"].items() 
-                     if k.startswith("parameter_") and isinstance(v, dict)}
-    
-    # Check each parameter has consistent number across languages
-    for param_key, en_data in en_parameters.items():
-        en_number = en_data.get("number")
-        assert en_number is not None, f"{param_key} missing number in English"
-        
-        for lang in ["zh", "ru", "ar"]:
-            if param_key in glossaries[lang]:
-                lang_data = glossaries[lang][param_key]
-                lang_number = lang_data.get("number")
-                
-                assert lang_number == en_number, \
-                    f"{param_key} has different number in {lang.upper()}: {lang_number} vs {en_number}"
+    _assert_numbering_consistent(glossaries, glossary_parameters["en"])
 
 
-def test_metadata_version_consistency(glossary_files):
+def test_metadata_version_consistency(glossary_metadata):
     """Test that all glossaries have metadata with version."""
-    for lang, filepath in glossary_files.items():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        
-        assert "metadata" in data, f"{lang.upper()} glossary missing metadata"
-        assert "version" in data["metadata"], f"{lang.upper()} metadata missing version"
-        assert "last_updated" in data["metadata"], f"{lang.upper()} metadata missing last_updated"
+    for lang, metadata in glossary_metadata.items():
+        assert metadata is not None, f"{lang.upper()} glossary missing metadata"
+        assert "version" in metadata, f"{lang.upper()} metadata missing version"
+        assert "last_updated" in metadata, f"{lang.upper()} metadata missing last_updated"
 
 
-def test_english_is_canonical(glossary_files):
+def test_english_is_canonical(glossaries):
     """Test that English glossary has 'en' fields for all terms."""
-    with open(glossary_files["en"], 'r', encoding='utf-8') as f:
-        en_data = yaml.safe_load(f)
+    en_data = glossaries["en"]
     
     terms = {k: v for k, v in en_data.items() if k != "metadata" and isinstance(v, dict)}
     
@@ -134,13 +97,12 @@ def test_english_is_canonical(glossary_files):
             f"Term '{term_key}' should have 'en' field or 'definition' in English glossary"
 
 
-def test_translations_not_empty(glossary_files):
+def test_translations_not_empty(glossaries):
     """Test that translations are not empty strings."""
     languages = ["zh", "ru", "ar"]
     
     for lang in languages:
-        with open(glossary_files[lang], 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = glossaries[lang]
         
         terms = {k: v for k, v in data.items() if k != "metadata" and isinstance(v, dict)}
         
@@ -151,10 +113,9 @@ def test_translations_not_empty(glossary_files):
                     f"Term '{term_key}' has empty {lang.upper()} translation"
 
 
-def test_definitions_consistency(glossary_files):
+def test_definitions_consistency(glossaries):
     """Test that English definitions are present for all terms."""
-    with open(glossary_files["en"], 'r', encoding='utf-8') as f:
-        en_data = yaml.safe_load(f)
+    en_data = glossaries["en"]
     
     terms = {k: v for k, v in en_data.items() if k != "metadata" and isinstance(v, dict)}
     
@@ -165,14 +126,8 @@ def test_definitions_consistency(glossary_files):
                 f"Term '{term_key}' should have a definition"
 
 
-def test_cross_language_term_structure(glossary_files):
+def test_cross_language_term_structure(glossaries):
     """Test that all languages have similar structure for each term."""
-    # Load all glossaries
-    glossaries = {}
-    for lang, filepath in glossary_files.items():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            glossaries[lang] = yaml.safe_load(f)
-    
     # Get a sample term from English
     sample_terms = ["triz", "contradiction", "principle_01_segmentation"]
     
@@ -198,10 +153,10 @@ def test_cross_language_term_structure(glossary_files):
                         print(f"Note: {term_key} in {lang.upper()} missing: {missing}")
 
 
-def test_glossary_file_sizes_reasonable(glossary_files):
+def test_glossary_file_sizes_reasonable(glossary_files, i18n_index):
     """Test that glossary files are of reasonable size."""
     for lang, filepath in glossary_files.items():
-        file_size = filepath.stat().st_size
+        file_size = i18n_index[filepath.name].stat().st_size
         
         # Each glossary should be at least 5KB (has substantial content)
         assert file_size > 5000, \
@@ -0,0 +1,164 @@
+"""
+Unit tests for the Heinrich command line interface.
+"""
+import asyncio
+import os
+
+import pytest
+
+import heinrich_cli
+from heinrich_cli import HeinrichCLI
+
+
+class TestInteractiveMode:
+    """Test cases for the interactive session."""
+
+    def test_tty_prompt_outside_event_loop(self, monkeypatch):
+        """Test that prompts on a TTY work before and after the concurrent steps."""
+        answers = [
+            "We need to make a car faster, but increasing engine power makes it consume more fuel.",
+            "1",
+        ]
+        prompts = []
+
+        def fake_prompt(message):
+            # prompt_toolkit's prompt() runs its own loop the same way
+            async def read():
+                return answers.pop(0)
+            prompts.append(message)
+            return asyncio.run(read())
+
+        async def fake_principles_and_effects():
+            pass
+
+        monkeypatch.setattr(heinrich_cli, "toolkit_prompt", fake_prompt)
+        monkeypatch.setattr(heinrich_cli.sys.stdin, "isatty", lambda: True)
+
+        cli = HeinrichCLI()
+        monkeypatch.setattr(cli, "print_persona_greeting", lambda: None)
+        monkeypatch.setattr(cli, "step_problem_analysis", lambda: None)
+        monkeypatch.setattr(cli, "step_contradiction_identification", lambda: None)
+        monkeypatch.setattr(cli, "_has_confident_contradiction", lambda result: True)
+        monkeypatch.setattr(cli, "step_principles_and_effects", fake_principles_and_effects)
+        monkeypatch.setattr(cli, "step_concept_generation", lambda: None)
+        monkeypatch.setattr(cli, "step_context_adaptation",
+                            lambda: cli.get_user_input("Select industry (1-7): "))
+        monkeypatch.setattr(cli, "step_report_generation", lambda: None)
+
+        cli.run_interactive_mode()
+
+        assert prompts == ["Your problem: ", "Select industry (1-7): "]
+        assert cli.current_problem.startswith("We need to make a car faster")
+
+    def test_adaptation_menus_keep_option_text(self, monkeypatch, capsys):
+        """Test that timeline options print as written while the other menus are title-cased."""
+        answers = iter(["2", "1", "3", "2", "3"])
+        cli = HeinrichCLI()
+        monkeypatch.setattr(cli, "get_user_input", lambda prompt: next(answers))
+
+        context = cli._collect_adaptation_context()
+
+        out = capsys.readouterr().out
+        assert "  1. short-term (weeks)\n" in out
+        assert "  2. Small/Medium Enterprise\n" in out
+        assert (context.industry, context.timeline) == ("aerospace", "medium-term")
+
+
+class TestBatchMode:
+    """Test cases for batch processing."""
+
+    def test_failing_problems_do_not_abort_batch(self, tmp_path, monkeypatch, capsys):
+        """Test that problems failing in a batched or a per-problem stage only lose their own report."""
+        problems = [
+            "We want to increase the speed of the vehicle but it reduces reliability.",
+            "We want to increase the speed of the pump but it reduces reliability.",
+            "We want to increase the speed of the aircraft but it reduces reliability.",
+            "We want to increase the speed of the conveyor but it reduces reliability.",
+        ]
+        input_file = tmp_path / "problems.txt"
+        input_file.write_text("\n".join(problems) + "\n", encoding="utf-8")
+
+        cli = HeinrichCLI()
+        parse = cli.problem_parser.parse
+        find_effects = cli.effects_lookup.find_effects_for_contradiction
+
+        def failing_parse(problem_text):
+            if "pump" in problem_text:
+                raise ValueError("unparseable")
+            return parse(problem_text)
+
+        def failing_find_effects(improving, worsening, domain_keywords):
+            if "aerospace" in domain_keywords:
+                raise KeyError("aerospace")
+            return find_effects(improving, worsening, domain_keywords)
+
+        # Step 2 is batched, step 5 runs per problem
+        monkeypatch.setattr(cli.problem_parser, "parse", failing_parse)
+        monkeypatch.setattr(cli.effects_lookup, "find_effects_for_contradiction", failing_find_effects)
+
+        cli.run_batch_mode(str(input_file), str(tmp_path / "reports"))
+
+        reports = sorted(path.name for path in (tmp_path / "reports").iterdir())
+        assert [name[-7:] for name in reports] == ["_001.md", "_004.md"]
+        out = capsys.readouterr().out
+        assert "Problem 2: analysis failed: unparseable" in out
+        assert "Problem 3: analysis failed" in out
+        assert "2/4 reports generated" in out
+
+
+class TestStageCache:
+    """Test cases for the on-disk stage cache."""
+
+    @pytest.fixture
+    def cli(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(heinrich_cli, "CACHE_DIR", tmp_path)
+        cli = HeinrichCLI()
+        cli.current_problem = "We need to make a car faster, but increasing engine power makes it consume more fuel."
+        return cli
+
+    def test_contradiction_round_trip(self, cli, tmp_path):
+        """Test that a cached contradiction result is stored as JSON and rebuilt."""
+        first = cli._cached(
+            "contradiction", cli.current_problem,
+            lambda: cli.contradiction_identifier.identify_contradiction(cli.current_problem),
+            heinrich_cli._load_contradiction_result
+        )
+        assert [path.suffix for path in tmp_path.iterdir()] == [".json"]
+
+        second = cli._cached(
+            "contradiction", cli.current_problem,
+            lambda: pytest.fail("cache miss"),
+            heinrich_cli._load_contradiction_result
+        )
+        assert second == first
+
+    def test_corrupt_entry_is_recomputed(self, cli, tmp_path):
+        """Test that an unreadable cache entry falls back to computing the result."""
+        cli._cached("parse", cli.current_problem, lambda: {"stale": True}, heinrich_cli._load_parsed_problem)
+        for path in tmp_path.iterdir():
+            path.write_bytes(b"\x80not json")
+
+        parsed = cli._cached(
+            "parse", cli.current_problem,
+            lambda: cli.problem_parser.parse(cli.current_problem),
+            heinrich_cli._load_parsed_problem
+        )
+        assert parsed.original_text == cli.current_problem
+
+    def test_expired_entries_are_pruned(self, cli, tmp_path):
+        """Test that a stage's first lookup deletes its expired entries and nothing else."""
+        stale = tmp_path / "parse_outdated.json"
+        other = tmp_path / "glossary_cache-0123.json"
+        for path in (stale, other):
+            path.write_text("{}", encoding="utf-8")
+            os.utime(path, (0, 0))
+
+        cli._cached(
+            "parse", cli.current_problem,
+            lambda: cli.problem_parser.parse(cli.current_problem),
+            heinrich_cli._load_parsed_problem
+        )
+
+        assert not stale.exists()
+        assert other.exists()
+        assert len(list(tmp_path.glob("parse_*.json"))) == 1
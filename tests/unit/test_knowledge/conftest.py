@@ -0,0 +1,11 @@
+"""
+Pytest configuration for knowledge base tests.
+"""
+import pytest
+from heinrich.knowledge.knowledge_loader import KnowledgeLoader
+
+
+@pytest.fixture(scope="session")
+def loader():
+    """Return a KnowledgeLoader shared by the session; its load_* results are memoized."""
+    return KnowledgeLoader()
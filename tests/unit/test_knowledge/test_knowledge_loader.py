@@ -14,32 +14,28 @@ class TestKnowledgeLoader:
         loader = KnowledgeLoader()
         assert loader is not None
 
-    def test_load_contradiction_matrix(self):
+    def test_load_contradiction_matrix(self, loader):
         """Test loading the contradiction matrix."""
-        loader = KnowledgeLoader()
         matrix = loader.load_contradiction_matrix()
         
         assert matrix is not None
         # The matrix should be a data structure with content
 
-    def test_load_principles(self):
+    def test_load_principles(self, loader):
         """Test loading the 40 principles."""
-        loader = KnowledgeLoader()
         principles = loader.load_40_principles()
         
         assert principles is not None
         # Should load principles data
 
-    def test_load_parameters(self):
+    def test_load_parameters(self, loader):
         """Test loading the 39 parameters."""
-        loader = KnowledgeLoader()
         parameters = loader.load_39_parameters()
         
         assert parameters is not None
         # Should load parameters data
 
-    def test_knowledge_base_path_exists(self):
+    def test_knowledge_base_path_exists(self, loader):
         """Test that the knowledge base directory exists."""
-        loader = KnowledgeLoader()
         # The knowledge loader should have a valid base path
         assert hasattr(loader, 'base_path') or hasattr(loader, 'knowledge_path')
@@ -0,0 +1,84 @@
+"""
+Pytest configuration for LLM adapter tests.
+"""
+import copy
+import sys
+import types
+from collections import namedtuple
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from heinrich.llm.adapters.gemini import GeminiAdapter
+
+# Immutable stand-ins for the SDK's response parts; ``copy.copy`` of the
+# response template shares them, so they must not be mutable
+Usage = namedtuple("Usage", "prompt_token_count candidates_token_count total_token_count")
+Candidate = namedtuple("Candidate", "finish_reason")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def stub_genai():
+    """Make ``import google.generativeai`` resolve to a lightweight stub.
+
+    Keeps the unit tests hermetic and spares them the real SDK's import
+    (gRPC, protobuf). Everything is restored when the module finishes.
+    """
+    stub = types.ModuleType("google.generativeai")
+    stub.configure = Mock()
+    stub.GenerativeModel = Mock()
+    
+    with pytest.MonkeyPatch.context() as mp:
+        google = sys.modules.get("google")
+        if google is None:
+            google = types.ModuleType("google")
+            google.__path__ = []
+            google._heinrich_stub = True
+            mp.setitem(sys.modules, "google", google)
+        mp.setitem(sys.modules, "google.generativeai", stub)
+        # ``import a.b as c`` reads the attribute on ``a`` before sys.modules
+        mp.setattr(google, "generativeai", stub, raising=False)
+        yield stub
+
+
+@pytest.fixture
+def real_genai(monkeypatch):
+    """Lift ``stub_genai`` for one test so the installed SDK is imported."""
+    monkeypatch.delitem(sys.modules, "google.generativeai", raising=False)
+    google = sys.modules.get("google")
+    if getattr(google, "_heinrich_stub", False):
+        monkeypatch.delitem(sys.modules, "google")
+    elif google is not None:
+        monkeypatch.delattr(google, "generativeai", raising=False)
+
+
+@pytest.fixture(scope="session")
+def gemini_response_template():
+    """Return a prebuilt Gemini response; tests take a ``copy.copy`` of it.
+
+    Only attribute reads are exercised, so plain objects stand in for Mocks.
+    """
+    return SimpleNamespace(
+        text="TRIZ analysis result",
+        usage_metadata=Usage(10, 50, 60),
+        candidates=(Candidate("STOP"),),
+    )
+
+
+@pytest.fixture(scope="session")
+def gemini_factory():
+    """Return a factory of ``GeminiAdapter({"api_key": "test"})`` copies.
+
+    The adapter is constructed once; each call returns a shallow copy with
+    optional instance attribute overrides applied.
+    """
+    template = GeminiAdapter({"api_key": "test"})
+    
+    def make(overrides=None):
+        adapter = copy.copy(template)
+        if overrides:
+            adapter.__dict__.update(overrides)
+        return adapter
+    
+    return make
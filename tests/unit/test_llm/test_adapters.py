@@ -5,6 +5,14 @@ import pytest
 from heinrich.llm.base_adapter import BaseLLMAdapter, LLMResponse, Message
 from heinrich.llm.adapters.ollama import OllamaAdapter
 
+# Fixed test objects, built once at import
+_MSG_USER_HELLO = Message(role="user", content="Hello")
+_LLM_RESP = LLMResponse(
+    content="Test response",
+    model="llama2",
+    usage={"prompt_tokens": 10, "completion_tokens": 20}
+)
+
 
 class TestBaseLLMAdapter:
     """Test cases for BaseLLMAdapter."""
@@ -15,45 +23,51 @@ class TestBaseLLMAdapter:
             BaseLLMAdapter({})
 
 
+@pytest.fixture(scope="class")
+def default_ollama():
+    """Return an OllamaAdapter built from a full config, shared by the class."""
+    return OllamaAdapter({
+        "model": "llama2",
+        "base_url": "http://localhost:11434",
+        "temperature": 0.7
+    })
+
+
+@pytest.fixture(scope="class")
+def minimal_ollama():
+    """Return an OllamaAdapter built from a minimal config, shared by the class."""
+    return OllamaAdapter({"model": "llama2"})
+
+
 class TestOllamaAdapter:
     """Test cases for OllamaAdapter."""
 
-    def test_ollama_adapter_initialization(self):
+    def test_ollama_adapter_initialization(self, default_ollama):
         """Test that OllamaAdapter initializes correctly."""
-        config = {
-            "model": "llama2",
-            "base_url": "http://localhost:11434",
-            "temperature": 0.7
-        }
-        adapter = OllamaAdapter(config)
+        adapter = default_ollama
         
         assert adapter is not None
         assert adapter.model == "llama2"
         assert adapter.temperature == 0.7
         assert adapter.base_url == "http://localhost:11434"
 
-    def test_ollama_adapter_default_config(self):
+    def test_ollama_adapter_default_config(self, minimal_ollama):
         """Test OllamaAdapter with minimal configuration."""
-        config = {"model": "llama2"}
-        adapter = OllamaAdapter(config)
+        adapter = minimal_ollama
         
         assert adapter.base_url == "http://localhost:11434"
         assert adapter.temperature == 0.7
 
     def test_message_creation(self):
         """Test creating Message objects."""
-        msg = Message(role="user", content="Hello")
+        msg = _MSG_USER_HELLO
         
         assert msg.role == "user"
         assert msg.content == "Hello"
 
     def test_llm_response_creation(self):
         """Test creating LLMResponse objects."""
-        response = LLMResponse(
-            content="Test response",
-            model="llama2",
-            usage={"prompt_tokens": 10, "completion_tokens": 20}
-        )
+        response = _LLM_RESP
         
         assert response.content == "Test response"
         assert response.model == "llama2"
@@ -3,85 +3,102 @@ Unit tests for Google Gemini LLM Adapter
 
 Author: Copilot powered by Claude Opus
 """
+import copy
+import os
+from importlib.util import find_spec
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 
 from heinrich.llm.adapters.gemini import GeminiAdapter
 from heinrich.llm.base_adapter import Message, LLMResponse
 
 
+def _has_module(name):
+    """Return True if ``name`` is importable, without importing it."""
+    try:
+        return find_spec(name) is not None
+    except ModuleNotFoundError:
+        # Parent package (``google``) is missing altogether
+        return False
+
+
+# Probe only; importing the SDK at collection time is expensive
+_HAS_GENAI = _has_module("google.generativeai")
+
+# Fixed chat history, built once at import
+_SYSTEM_USER_MESSAGES = (
+    Message(role="system", content="You are a TRIZ expert"),
+    Message(role="user", content="What is TRIZ?"),
+)
+
+
+def _make_ready_adapter(config, client_type="vertex"):
+    """Return a GeminiAdapter marked as initialized, set directly rather than patched."""
+    adapter = GeminiAdapter(config)
+    adapter._client_type = client_type
+    adapter._initialized = True
+    return adapter
+
+
 class TestGeminiAdapterInit:
     """Test GeminiAdapter initialization."""
     
-    def test_init_with_api_key(self):
-        """Test initialization with API key."""
-        config = {
-            "api_key": "test-api-key",
-            "model": "gemini-1.5-pro",
-            "temperature": 0.5,
-        }
-        adapter = GeminiAdapter(config)
-        
-        assert adapter.api_key == "test-api-key"
-        assert adapter.model == "gemini-1.5-pro"
-        assert adapter.temperature == 0.5
-        assert adapter.use_vertex is False
-    
-    def test_init_with_vertex_ai(self):
-        """Test initialization with Vertex AI config."""
-        config = {
-            "project_id": "my-gcp-project",
-            "location": "us-east1",
-            "model": "gemini-1.5-flash",
-            "use_vertex": True,
-        }
-        adapter = GeminiAdapter(config)
-        
-        assert adapter.project_id == "my-gcp-project"
-        assert adapter.location == "us-east1"
-        assert adapter.use_vertex is True
+    @pytest.mark.parametrize("config,expected", [
+        (
+            {"api_key": "test-api-key", "model": "gemini-1.5-pro", "temperature": 0.5},
+            {"api_key": "test-api-key", "model": "gemini-1.5-pro", "temperature": 0.5, "use_vertex": False},
+        ),
+        (
+            {"project_id": "my-gcp-project", "location": "us-east1",
+             "model": "gemini-1.5-flash", "use_vertex": True},
+            {"project_id": "my-gcp-project", "location": "us-east1", "use_vertex": True},
+        ),
+        (
+            {"api_key": "test"},
+            {"model": "gemini-1.5-pro", "temperature": 0.7, "location": "us-central1"},
+        ),
+    ], ids=["api_key", "vertex_ai", "defaults"])
+    def test_init(self, config, expected):
+        """Test that configuration (or its defaults) lands on the adapter."""
+        attrs = vars(GeminiAdapter(config))
+        
+        assert expected.items() <= attrs.items(), {k: attrs.get(k) for k in expected}
+
+
+@pytest.fixture(scope="class")
+def genai_mocks():
+    """Swap the SDK entry points for mocks once for the whole class."""
+    import google.generativeai as genai
     
-    def test_default_values(self):
-        """Test default configuration values."""
-        config = {"api_key": "test"}
-        adapter = GeminiAdapter(config)
-        
-        assert adapter.model == "gemini-1.5-pro"
-        assert adapter.temperature == 0.7
-        assert adapter.location == "us-central1"
+    with pytest.MonkeyPatch.context() as mp:
+        # Explicit spec_set lists, not spec=GenerativeModel: no introspection
+        # of the SDK classes, and typos in attribute names fail loudly
+        mp.setattr(genai, "GenerativeModel", Mock(spec_set=["__call__"]))
+        mp.setattr(genai, "configure", Mock(spec_set=["__call__"]))
+        yield genai
 
 
+@pytest.mark.usefixtures("genai_mocks")
 class TestGeminiAdapterGenerate:
     """Test GeminiAdapter generate method."""
     
-    @patch('heinrich.llm.adapters.gemini.GeminiAdapter._ensure_initialized')
-    def test_generate_not_initialized(self, mock_init):
+    def test_generate_not_initialized(self, gemini_factory):
         """Test generate when initialization fails."""
-        mock_init.return_value = False
+        # Instance attribute shadows the method; nothing to restore
+        adapter = gemini_factory({"_ensure_initialized": lambda: False})
         
-        adapter = GeminiAdapter({"api_key": "test"})
         response = adapter.generate("test prompt")
         
         assert "Error" in response.content
         assert response.metadata.get("error") == "initialization_failed"
     
-    @patch('google.generativeai.GenerativeModel')
-    @patch('google.generativeai.configure')
-    def test_generate_success(self, mock_configure, mock_model_class):
+    def test_generate_success(self, genai_mocks, gemini_response_template):
         """Test successful generation."""
         # Setup mock
-        mock_response = Mock()
-        mock_response.text = "TRIZ analysis result"
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=10,
-            candidates_token_count=50,
-            total_token_count=60
-        )
-        mock_response.candidates = [Mock(finish_reason="STOP")]
-        
-        mock_model = Mock()
-        mock_model.generate_content.return_value = mock_response
-        mock_model_class.return_value = mock_model
+        mock_model = Mock(spec_set=["generate_content"])
+        mock_model.generate_content.return_value = copy.copy(gemini_response_template)
+        genai_mocks.GenerativeModel.return_value = mock_model
         
         adapter = GeminiAdapter({"api_key": "test-key"})
         response = adapter.generate("Analyze this problem")
@@ -93,19 +110,25 @@ class TestGeminiAdapterGenerate:
 class TestGeminiAdapterChat:
     """Test GeminiAdapter chat method."""
     
-    def test_chat_with_messages(self):
-        """Test chat with message history."""
-        adapter = GeminiAdapter({"api_key": "test"})
-        
-        messages = [
-            Message(role="system", content="You are a TRIZ expert"),
-            Message(role="user", content="What is TRIZ?"),
-        ]
-        
-        # Since we can't actually call the API, test the message processing
-        assert len(messages) == 2
-        assert messages[0].role == "system"
-        assert messages[1].role == "user"
+    def test_chat_with_messages(self, gemini_factory, genai_mocks, gemini_response_template):
+        """Test that the system message becomes the instruction and the user message is sent."""
+        mock_chat = Mock(spec_set=["send_message"])
+        mock_chat.send_message.return_value = copy.copy(gemini_response_template)
+        mock_model = Mock(spec_set=["start_chat"])
+        mock_model.start_chat.return_value = mock_chat
+        genai_mocks.GenerativeModel.return_value = mock_model
+        
+        adapter = gemini_factory()
+        response = adapter.chat(list(_SYSTEM_USER_MESSAGES))
+        
+        genai_mocks.GenerativeModel.assert_called_with(
+            "gemini-1.5-pro", system_instruction="You are a TRIZ expert"
+        )
+        mock_model.start_chat.assert_called_once_with(history=[])
+        mock_chat.send_message.assert_called_once_with(
+            "What is TRIZ?", generation_config={"temperature": 0.7}
+        )
+        assert response.content == "TRIZ analysis result"
 
 
 class TestGeminiAdapterHelpers:
@@ -113,33 +136,24 @@ class TestGeminiAdapterHelpers:
     
     def test_list_models_vertex(self):
         """Test list_models for Vertex AI."""
-        adapter = GeminiAdapter({
-            "use_vertex": True,
-            "project_id": "test"
-        })
-        adapter._client_type = "vertex"
-        adapter._initialized = True
-        
-        models = adapter.list_models()
+        adapter = _make_ready_adapter({"use_vertex": True, "project_id": "test"})
         
-        assert "gemini-1.5-pro" in models
-        assert "gemini-1.5-flash" in models
+        assert {"gemini-1.5-pro", "gemini-1.5-flash"} <= set(adapter.list_models())
 
 
+@pytest.mark.integration
+@pytest.mark.llm
 class TestGeminiAdapterIntegration:
     """Integration tests (require API key)."""
     
+    @pytest.mark.usefixtures("real_genai")
     @pytest.mark.skipif(
-        not pytest.importorskip("google.generativeai", reason="google-generativeai not installed"),
-        reason="Requires google-generativeai package"
+        not _HAS_GENAI or not os.environ.get("GEMINI_API_KEY"),
+        reason="Requires google-generativeai package and GEMINI_API_KEY"
     )
     def test_real_api_call(self):
         """Test with real API (requires GEMINI_API_KEY env var)."""
-        import os
-        api_key = os.environ.get("GEMINI_API_KEY")
-        
-        if not api_key:
-            pytest.skip("GEMINI_API_KEY not set")
+        api_key = os.environ["GEMINI_API_KEY"]
         
         adapter = GeminiAdapter({
             "api_key": api_key,
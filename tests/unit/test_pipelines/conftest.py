@@ -0,0 +1,11 @@
+"""
+Pytest configuration for pipeline tests.
+"""
+import pytest
+from heinrich.pipelines.problem_parser import ProblemParser
+
+
+@pytest.fixture(scope="session")
+def parsed_sample(sample_problem_text):
+    """Return the sample problem parsed once per session; parsing is deterministic."""
+    return ProblemParser().parse(sample_problem_text)
@@ -0,0 +1,55 @@
+"""
+Unit tests for the PrincipleSelector module.
+"""
+import pytest
+from heinrich.pipelines.principle_selector import PrincipleSelector
+
+# (improving, worsening) pairs: matrix hits, cells without an entry,
+# same-parameter pairs and IDs outside 1-39
+_PARAMETER_PAIRS = [
+    (9, 19), (14, 1), (1, 2), (12, 13), (9, 9), (39, 39),
+    (0, 5), (40, 1), (-1, 3), (3, 99),
+]
+
+
+@pytest.fixture(scope="module")
+def selector():
+    """Return one PrincipleSelector shared by the module."""
+    return PrincipleSelector()
+
+
+def _outcome(select, *args):
+    """Return the selection result, or the type of the exception it raised."""
+    try:
+        return select(*args)
+    except Exception as e:
+        return type(e)
+
+
+class TestPrincipleSelector:
+    """Test cases for PrincipleSelector."""
+
+    @pytest.mark.parametrize("pair", _PARAMETER_PAIRS, ids=str)
+    def test_batch_matches_single_selection(self, selector, pair):
+        """Test that the vectorized batch path equals select_principles for one contradiction."""
+        contradiction = {"improving_parameter": pair[0], "worsening_parameter": pair[1]}
+
+        batched = _outcome(lambda: selector.select_principles_for_contradictions([contradiction])[0])
+
+        assert batched == _outcome(selector.select_principles, *pair)
+
+    def test_batch_matches_single_selection_in_order(self, selector):
+        """Test that a mixed batch returns one result per contradiction, in input order."""
+        pairs = [pair for pair in _PARAMETER_PAIRS if all(0 < p < 40 for p in pair)]
+        contradictions = [
+            {"improving_parameter": improving, "worsening_parameter": worsening}
+            for improving, worsening in pairs
+        ]
+
+        results = selector.select_principles_for_contradictions(contradictions)
+
+        assert results == [selector.select_principles(*pair) for pair in pairs]
+
+    def test_empty_batch(self, selector):
+        """Test that no contradictions select nothing."""
+        assert selector.select_principles_for_contradictions([]) == []
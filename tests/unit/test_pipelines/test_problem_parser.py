@@ -2,7 +2,13 @@
 Unit tests for the ProblemParser module.
 """
 import pytest
-from heinrich.pipelines.problem_parser import ProblemParser, ParsedProblem
+from heinrich.pipelines.problem_parser import ProblemParser, ParsedProblem, ParsedProblemBatch
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Return one ProblemParser shared by the module."""
+    return ProblemParser()
 
 
 class TestProblemParser:
@@ -13,48 +19,48 @@ class TestProblemParser:
         parser = ProblemParser()
         assert parser is not None
 
-    def test_parse_basic_problem(self, sample_problem_text):
-        """Test parsing a basic problem statement."""
-        parser = ProblemParser()
-        result = parser.parse(sample_problem_text)
-        
-        assert isinstance(result, ParsedProblem)
-        assert result.technical_system is not None
-        assert result.desired_improvement is not None
-        assert result.undesired_consequence is not None
+    @pytest.mark.parametrize("attr,check", [
+        ("technical_system", lambda v: v is not None),
+        ("desired_improvement", lambda v: v is not None),
+        ("undesired_consequence", lambda v: v is not None),
+        ("constraints", lambda v: isinstance(v, list)),
+        ("context", lambda v: isinstance(v, dict)),
+    ])
+    def test_parsed_fields(self, parsed_sample, attr, check):
+        """Test each field of the parsed sample problem."""
+        assert isinstance(parsed_sample, ParsedProblem)
+        assert check(getattr(parsed_sample, attr))
 
-    def test_parse_returns_parsed_problem_object(self):
+    def test_parse_returns_parsed_problem_object(self, parser):
         """Test that parse returns a ParsedProblem object."""
-        parser = ProblemParser()
         problem_text = "Make the machine stronger but not heavier"
         result = parser.parse(problem_text)
         
+        expected = {"technical_system", "desired_improvement", "undesired_consequence",
+                    "constraints", "context"}
         assert isinstance(result, ParsedProblem)
-        assert hasattr(result, 'technical_system')
-        assert hasattr(result, 'desired_improvement')
-        assert hasattr(result, 'undesired_consequence')
-        assert hasattr(result, 'constraints')
-        assert hasattr(result, 'context')
+        assert expected <= vars(result).keys()
 
-    def test_parse_empty_string(self):
+    def test_parse_empty_string(self, parser):
         """Test parsing an empty string."""
-        parser = ProblemParser()
         result = parser.parse("")
         
         assert isinstance(result, ParsedProblem)
         # Should handle empty input gracefully
 
-    def test_parsed_problem_has_context(self, sample_problem_text):
-        """Test that parsed problem includes context."""
-        parser = ProblemParser()
-        result = parser.parse(sample_problem_text)
+    def test_parse_batch_preserves_order(self, parser, sample_problem_text):
+        """Test that parse_batch returns one result per input, in order."""
+        problems = [sample_problem_text, "Make the machine stronger but not heavier"]
+        results = parser.parse_batch(problems)
         
-        assert isinstance(result.context, dict)
-        assert 'domain' in result.context or len(result.context) >= 0
+        assert [r.original_text for r in results] == problems
 
-    def test_constraints_is_list(self, sample_problem_text):
-        """Test that constraints field is a list."""
-        parser = ProblemParser()
-        result = parser.parse(sample_problem_text)
+    def test_parse_many_matches_parse(self, parser, sample_problem_text):
+        """Test that each parse_many row equals the single-problem parse."""
+        problems = [sample_problem_text, "Make the machine stronger but not heavier", ""]
+        batch = parser.parse_many(problems)
         
-        assert isinstance(result.constraints, list)
+        assert isinstance(batch, ParsedProblemBatch)
+        assert len(batch) == len(problems)
+        for i, problem_text in enumerate(problems):
+            assert batch.problem(i) == parser.parse(problem_text)
@@ -0,0 +1,48 @@
+"""
+Unit tests for the logging configuration module.
+"""
+import logging
+
+import pytest
+
+from heinrich.utils import logging_config
+from heinrich.utils.logging_config import get_logger, setup_logging
+
+
+@pytest.fixture
+def clean_root_logger():
+    """Return the root logger, restoring its handlers and level afterwards."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield root
+    logging_config._stop_queue_listener()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    def test_second_call_keeps_file_logging(self, clean_root_logger, tmp_path):
+        """Test that records reach the new log file after setup_logging runs twice."""
+        first_log = tmp_path / "first.log"
+        second_log = tmp_path / "second.log"
+        logger = get_logger("test")
+        # pytest attaches its capture handlers after fixture setup; start bare
+        # so basicConfig installs ours
+        clean_root_logger.handlers = []
+
+        setup_logging(log_file=first_log)
+        logger.info("first record")
+
+        setup_logging(log_file=second_log)
+        logger.info("second record")
+        logging_config._stop_queue_listener()
+
+        assert "first record" in first_log.read_text()
+        assert "second record" in second_log.read_text()
+        queue_handlers = [h for h in clean_root_logger.handlers
+                          if isinstance(h, logging.handlers.QueueHandler)]
+        assert queue_handlers == []